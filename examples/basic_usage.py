@@ -1,12 +1,17 @@
 """Basic usage examples for Dolos."""
 
+import sys
 from datetime import datetime
-from pathlib import Path
 from dolos.text_parser import split_into_sentences
 from dolos.metadata_manager import MetadataManager
 from dolos.document_builder import DocumentBuilder
 from dolos.xml_injector import TrackChangesInjector
 
+# Shared across the examples so the database engine, builder and injector are set up once
+_METADATA_MGR = MetadataManager("data/dolos.db")
+_DOC_BUILDER = DocumentBuilder()
+_TRACK_INJECTOR = TrackChangesInjector()
+
 
 def example_create_document():
     """Example: Create a document with fake edit history."""
@@ -21,14 +26,9 @@ def example_create_document():
     sentences = split_into_sentences(text)
     print(f"Parsed {len(sentences)} sentences")
 
-    # Initialize managers
-    metadata_mgr = MetadataManager("data/dolos.db")
-    doc_builder = DocumentBuilder()
-    track_injector = TrackChangesInjector()
-
     # Create document with metadata
     start_time = datetime(2025, 1, 1, 10, 0, 0)
-    doc = metadata_mgr.create_document(
+    doc = _METADATA_MGR.create_document(
         filename="example.docx",
         sentences=sentences,
         start_timestamp=start_time,
@@ -37,24 +37,14 @@ def example_create_document():
         author="John Doe"
     )
 
-    # Build DOCX
-    temp_path = "temp_example.docx"
-    doc_builder.create_document(
-        sentences=doc.sentences,
-        output_path=temp_path,
-        author="John Doe"
-    )
-
-    # Inject track changes
-    track_injector.inject_track_changes(
-        docx_path=temp_path,
+    # Build DOCX and inject track changes in one pass
+    _DOC_BUILDER.create_document_with_track_changes(
         sentences=doc.sentences,
-        output_path="example.docx"
+        output_path="example.docx",
+        author="John Doe",
+        injector=_TRACK_INJECTOR
     )
 
-    # Cleanup
-    Path(temp_path).unlink(missing_ok=True)
-
     print("✓ Document created: example.docx")
     print(f"  Sentences: {len(sentences)}")
     print(f"  Time range: {doc.created_at} → {doc.last_modified}")
@@ -62,9 +52,7 @@ def example_create_document():
 
 def example_view_metadata():
     """Example: View metadata for a document."""
-    metadata_mgr = MetadataManager("data/dolos.db")
-
-    metadata = metadata_mgr.get_document_metadata("example.docx")
+    metadata = _METADATA_MGR.get_document_metadata("example.docx")
 
     if metadata:
         print("\nDocument Metadata:")
@@ -74,46 +62,29 @@ def example_view_metadata():
         print(f"  Sentences: {metadata['sentence_count']}")
 
         print("\nSentences:")
-        for sent in metadata['sentences']:
-            print(f"  [{sent['position']}] {sent['text'][:50]}...")
-            print(f"      Created: {sent['created']}")
+        # Build the listing once and write it in a single call
+        sys.stdout.write("".join(
+            f"  [{sent['position']}] {sent['text'][:50]}...\n      Created: {sent['created']}\n"
+            for sent in metadata['sentences']
+        ))
 
 
 def example_edit_timestamp():
     """Example: Edit a sentence timestamp."""
-    metadata_mgr = MetadataManager("data/dolos.db")
-    doc_builder = DocumentBuilder()
-    track_injector = TrackChangesInjector()
-
     # Update timestamp
     new_time = datetime(2025, 2, 15, 15, 30, 0)
-    success = metadata_mgr.update_sentence_timestamp(
+    doc = _METADATA_MGR.update_sentence_timestamp(
         document_filename="example.docx",
         sentence_position=0,
         new_timestamp=new_time
     )
 
-    if success:
+    if doc is not None:
         print("✓ Timestamp updated")
 
-        # Rebuild document
-        doc = metadata_mgr.get_document_by_filename("example.docx")
-        temp_path = "temp_example.docx"
-
-        doc_builder.create_document(
-            sentences=doc.sentences,
-            output_path=temp_path,
-            author=doc.author
-        )
-
-        track_injector.inject_track_changes(
-            docx_path=temp_path,
-            sentences=doc.sentences,
-            output_path="example.docx"
-        )
-
-        Path(temp_path).unlink(missing_ok=True)
-        print("✓ Document rebuilt with new timestamp")
+        # Patch only the changed insertion date instead of rebuilding the document
+        _TRACK_INJECTOR.patch_timestamps("example.docx", {0: new_time}, "example.docx")
+        print("✓ Document updated with new timestamp")
 
 
 if __name__ == "__main__":
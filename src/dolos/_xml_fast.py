@@ -0,0 +1,109 @@
+"""Shared helpers for emitting WordprocessingML directly as bytes."""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+# Byte-level edits rely on w: being bound to the WordprocessingML namespace
+_W_PREFIX_DECL = b'xmlns:w="' + W_NS.encode() + b'"'
+
+# A w:trackRevisions element, self-closing or with content
+_TRACK_REVISIONS_RE = re.compile(rb'<w:trackRevisions\b[^>]*?(?:/>|>.*?</w:trackRevisions>)', re.S)
+
+# Characters outside the XML Char production; lxml refuses these as well
+_XML_INVALID_CHAR_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+# Attribute values additionally need quotes and whitespace escaped
+_XML_ATTR_ESC_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    '\n': '&#10;',
+    '\r': '&#13;',
+    '\t': '&#9;',
+})
+
+
+def _check_xml_chars(text: str) -> None:
+    """Reject text that cannot be written as XML, the way lxml does.
+
+    Args:
+        text: Raw text
+
+    Raises:
+        ValueError: If the text contains control characters, lone surrogates
+            or other code points outside the XML Char range
+    """
+    match = _XML_INVALID_CHAR_RE.search(text)
+    if match is not None:
+        raise ValueError(
+            "All strings must be XML compatible: Unicode or ASCII, no NULL bytes "
+            f"or control characters (found {match.group()!r} at index {match.start()})"
+        )
+
+
+@lru_cache(maxsize=8192)
+def _xml_escape(text: str) -> bytes:
+    """Escape text for use as XML character data.
+
+    The cache is process-wide, so the builder and injector share hits when
+    the same sentences pass through both.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Escaped UTF-8 bytes
+
+    Raises:
+        ValueError: If the text contains characters XML does not allow
+    """
+    _check_xml_chars(text)
+    # Character data needs & < > escaped, plus \r, which parsers would
+    # otherwise normalize to \n (lxml writes it as &#13; too). Chained replace()
+    # calls scan the text in C and return it unchanged when nothing matches,
+    # which is far faster than str.translate with a mapping for sentence-length text.
+    return (
+        text.replace('&', '&amp;')
+        .replace('<', '&lt;')
+        .replace('>', '&gt;')
+        .replace('\r', '&#13;')
+        .encode('utf-8')
+    )
+
+
+@lru_cache(maxsize=256)
+def _xml_escape_attr(value: str) -> bytes:
+    """Escape text for use inside a double-quoted XML attribute.
+
+    Args:
+        value: Raw attribute value
+
+    Returns:
+        Escaped UTF-8 bytes
+
+    Raises:
+        ValueError: If the value contains characters XML does not allow
+    """
+    _check_xml_chars(value)
+    return value.translate(_XML_ATTR_ESC_TABLE).encode('utf-8')
+
+
+def _w3c_date(dt: datetime) -> bytes:
+    """Format a timestamp as a W3C date the way Word writes w:date.
+
+    Equivalent to strftime("%Y-%m-%dT%H:%M:%SZ") but avoids walking the
+    format string once per tracked change.
+
+    Args:
+        dt: Timestamp to format
+
+    Returns:
+        ASCII bytes such as b"2025-01-01T10:00:00Z"
+    """
+    return b'%04d-%02d-%02dT%02d:%02d:%02dZ' % (
+        dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
+    )
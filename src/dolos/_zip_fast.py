@@ -0,0 +1,82 @@
+"""Shared helpers for rewriting ZIP packages without recompressing them."""
+
+import copy
+import posixpath
+import zipfile
+
+# General purpose flag: CRC and sizes follow the data in a descriptor
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+# Private ZipFile state the raw copy writes through (stable since Python 3.6)
+_ZIPFILE_WRITE_ATTRS = ('fp', '_lock', '_seekable', 'start_dir', 'filelist', 'NameToInfo', '_didModify')
+
+# Media formats that are already compressed; deflating them again gains nothing
+_STORED_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.tif', '.tiff',
+    '.mp3', '.mp4', '.m4a', '.wav', '.wmv', '.avi', '.mov',
+    '.zip', '.docx', '.xlsx', '.pptx',
+})
+
+
+def _compress_type(name: str) -> int:
+    """Pick the compression method for a new archive member.
+
+    Args:
+        name: Archive member name
+
+    Returns:
+        zipfile.ZIP_STORED for already-compressed media, else zipfile.ZIP_DEFLATED
+    """
+    suffix = posixpath.splitext(name)[1].lower()
+    return zipfile.ZIP_STORED if suffix in _STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _copy_entry(zin: zipfile.ZipFile, zout: zipfile.ZipFile, zinfo: zipfile.ZipInfo) -> None:
+    """Copy an entry's compressed bytes verbatim into another archive.
+
+    Unchanged parts keep their original compression without an inflate and
+    deflate round trip. The local header is rewritten with the CRC and sizes
+    already recorded in the source's central directory.
+
+    This writes through private zipfile state; if a Python version lacks it,
+    the entry is decompressed and written again with writestr instead.
+
+    Args:
+        zin: Source archive opened for reading
+        zout: Destination archive opened for writing
+        zinfo: Entry of zin to copy
+
+    Raises:
+        ValueError: If zout has an entry open for writing, as ZipFile.writestr does
+    """
+    if getattr(zout, '_writing', False):
+        raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+
+    info = copy.copy(zinfo)
+
+    if not all(hasattr(zout, attr) for attr in _ZIPFILE_WRITE_ATTRS):
+        zout.writestr(info, zin.read(zinfo))
+        return
+
+    # Opening the entry validates its local header and leaves the raw stream at the data
+    with zin.open(zinfo) as src:
+        fileobj = getattr(src, '_fileobj', None)
+        raw = None if fileobj is None else fileobj.read(zinfo.compress_size)
+
+    if raw is None:
+        zout.writestr(info, zin.read(zinfo))
+        return
+
+    info.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+
+    with zout._lock:
+        if zout._seekable:
+            zout.fp.seek(zout.start_dir)
+        info.header_offset = zout.fp.tell()
+        zout.fp.write(info.FileHeader())
+        zout.fp.write(raw)
+        zout.start_dir = zout.fp.tell()
+
+        zout.filelist.append(info)
+        zout.NameToInfo[info.filename] = info
+        zout._didModify = True
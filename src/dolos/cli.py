@@ -1,25 +1,20 @@
 """Command-line interface for Dolos."""
 
-import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich.panel import Panel
 from rich import print as rprint
 
 from . import __version__
 from .text_parser import split_into_sentences
-from .metadata_manager import MetadataManager
-from .document_builder import DocumentBuilder
-from .xml_injector import TrackChangesInjector
-from .sanitizer import DocumentSanitizer
-from .metadata_editor import MetadataEditor
 from .utils import parse_timestamp, ensure_directory
 
 # Initialize Typer app
@@ -31,8 +26,258 @@ app = typer.Typer(
     no_args_is_help=False
 )
 
+# Piped/redirected output gets no colour, so skip Rich's highlighter there
+_TTY = sys.stdout.isatty()
+
 # Rich console for beautiful output
-console = Console()
+console = Console(highlight=_TTY)
+
+
+class _StatusBuffer:
+    """Collect a command's progress lines and print them in one call.
+
+    On a terminal each line is printed immediately so progress stays live;
+    when output is piped the lines are joined and written once at flush.
+    """
+
+    def __init__(self, console: Console):
+        """Initialize status buffer.
+
+        Args:
+            console: Console to print to
+        """
+        self.console = console
+        self._immediate = console.is_terminal
+        self._lines: List[str] = []
+
+    def add(self, message: str):
+        """Queue a status line (printed right away on a terminal).
+
+        Args:
+            message: Rich markup line
+        """
+        if self._immediate:
+            self.console.print(message)
+        else:
+            self._lines.append(message)
+
+    def flush(self):
+        """Print any queued lines."""
+        if self._lines:
+            self.console.print("\n".join(self._lines))
+            self._lines.clear()
+
+
+@lru_cache(maxsize=4)
+def _metadata_manager(db_path: str):
+    """Get the metadata manager for a database, shared by every command in this process."""
+    from .metadata_manager import MetadataManager
+    return MetadataManager(db_path)
+
+
+@lru_cache(maxsize=None)
+def _document_builder():
+    """Get the shared document builder."""
+    from .document_builder import DocumentBuilder
+    return DocumentBuilder()
+
+
+@lru_cache(maxsize=None)
+def _track_injector():
+    """Get the shared track changes injector."""
+    from .xml_injector import TrackChangesInjector
+    return TrackChangesInjector()
+
+
+@lru_cache(maxsize=None)
+def _sanitizer():
+    """Get the shared document sanitizer."""
+    from .sanitizer import DocumentSanitizer
+    return DocumentSanitizer()
+
+
+# Status line for each document build mode
+_BUILD_MODE_MESSAGES = {
+    "clean": "[cyan]Creating clean document (no track changes)...[/cyan]",
+    "final": "[cyan]Creating document with timestamps (final text, not suggestions)...[/cyan]",
+    "suggestions": "[cyan]Injecting track changes (will show as suggestions)...[/cyan]",
+}
+
+# Summary label for each build mode in interactive mode
+_MODE_SUMMARIES = {
+    "clean": "Clean document (no timestamps)",
+    "final": "Final text with timestamps",
+    "suggestions": "Track changes (suggestions)",
+}
+
+
+def _build_mode(no_track_changes: bool, accept_all_changes: bool) -> str:
+    """Map the create flags to a document build mode."""
+    if no_track_changes:
+        return "clean"
+    return "final" if accept_all_changes else "suggestions"
+
+
+def _finish_clean(sentences, output_path: str, **properties) -> None:
+    """Write a plain DOCX with no tracked changes."""
+    _document_builder().create_document(sentences=sentences, output_path=output_path, **properties)
+
+
+def _finish_final(sentences, output_path: str, **properties) -> None:
+    """Write a DOCX whose text is final but keeps per-sentence timestamps."""
+    _document_builder().create_document_with_track_changes(
+        sentences=sentences,
+        output_path=output_path,
+        accept_changes=True,
+        injector=_track_injector(),
+        **properties
+    )
+
+
+def _finish_suggestions(sentences, output_path: str, **properties) -> None:
+    """Write a DOCX showing each sentence as a tracked insertion."""
+    _document_builder().create_document_with_track_changes(
+        sentences=sentences,
+        output_path=output_path,
+        accept_changes=False,
+        injector=_track_injector(),
+        **properties
+    )
+
+
+# Finishing step for each build mode, chosen once per command
+_FINISHERS = {
+    "clean": _finish_clean,
+    "final": _finish_final,
+    "suggestions": _finish_suggestions,
+}
+
+
+def _build_document(
+    sentences,
+    output_path: str,
+    *,
+    author: str,
+    title: Optional[str] = None,
+    subject: Optional[str] = None,
+    keywords: Optional[str] = None,
+    comments: Optional[str] = None,
+    mode: Literal["clean", "final", "suggestions"] = "suggestions"
+) -> None:
+    """Write the DOCX for stored sentences.
+
+    Args:
+        sentences: Sentence objects from the metadata store
+        output_path: Output DOCX path
+        author: Document author
+        title: Document title
+        subject: Document subject
+        keywords: Document keywords/tags
+        comments: Document comments
+        mode: 'clean' (no track changes), 'final' (timestamps kept, text accepted)
+            or 'suggestions' (sentences shown as tracked insertions)
+    """
+    _FINISHERS[mode](
+        sentences,
+        output_path,
+        author=author,
+        title=title,
+        subject=subject,
+        keywords=keywords,
+        comments=comments
+    )
+
+
+def _export_json(data: dict, path: Path) -> None:
+    """Write data to a file as indented JSON.
+
+    Uses orjson when it is installed (pip install .[fast]), otherwise the
+    standard library encoder with a single write.
+
+    Args:
+        data: JSON-serializable data
+        path: Output file path
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2))
+        return
+
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+def _preview(text: str, limit: int = 50) -> str:
+    """Truncate text for table display, marking cut text with an ellipsis."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _read_text_file(path: Path) -> str:
+    """Read a UTF-8 text file through a large text-mode buffer.
+
+    Text mode keeps universal newline translation, so '\r\n' line endings do
+    not reach sentence parsing or the character counts shown to the user.
+
+    Args:
+        path: Path to the text file
+
+    Returns:
+        File contents
+    """
+    with open(path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+        return f.read()
+
+
+@lru_cache(maxsize=8)
+def _rendered_rows(doc_key: tuple) -> tuple:
+    """Format sentence metadata cells, memoized on the sentence content.
+
+    Args:
+        doc_key: Tuple of (position, text, created, modified) per sentence
+
+    Returns:
+        Tuple of (position, preview, created, modified) string cells
+    """
+    return tuple(
+        (str(position), _preview(text), created, modified)
+        for position, text, created, modified in doc_key
+    )
+
+
+# Column index of each timestamp field in a rendered row
+_TIMESTAMP_COLUMNS = {'created': 2, 'modified': 3}
+
+
+def _sentence_rows(sentences, *timestamp_fields: str) -> list:
+    """Build Rich table rows for sentence metadata in one pass.
+
+    Cells are plain Text objects, so Rich skips markup parsing when rendering
+    (and sentence text containing brackets is never misread as markup).
+    The formatted strings are shared across views of unchanged metadata.
+
+    Args:
+        sentences: Sentence dicts from MetadataManager.get_document_metadata
+        timestamp_fields: Keys of the timestamp columns to include, in order
+
+    Returns:
+        List of row tuples ready for Table.add_row
+    """
+    from rich.text import Text
+
+    doc_key = tuple(
+        (sent['position'], sent['text'], sent['created'], sent['modified'])
+        for sent in sentences
+    )
+    columns = [_TIMESTAMP_COLUMNS[field] for field in timestamp_fields]
+
+    return [
+        (Text(row[0]), Text(row[1]), *(Text(row[col]) for col in columns))
+        for row in _rendered_rows(doc_key)
+    ]
 
 
 @app.command()
@@ -61,10 +306,16 @@ def create(
         dolos create --input-file text.txt -o output.docx
         dolos create "Sample text." --start-date "2025-01-01 10:00:00"
     """
+    from .metadata_editor import MetadataEditor
+
+    status = _StatusBuffer(console)
+
     try:
         # Ensure output path has .docx extension
-        if not str(output).lower().endswith('.docx'):
-            output = Path(str(output) + '.docx')
+        out_s = os.fspath(output)
+        if not out_s.lower().endswith('.docx'):
+            out_s += '.docx'
+            output = Path(out_s)
             console.print(f"[yellow]Info:[/yellow] Added .docx extension to output path: {output}")
 
         # Get text content
@@ -76,9 +327,9 @@ def create(
             if not input_file.exists():
                 console.print(f"[red]Error:[/red] File not found: {input_file}", style="bold")
                 sys.exit(1)
-            text = input_file.read_text(encoding='utf-8')
+            text = _read_text_file(input_file)
 
-        if not text or not text.strip():
+        if not text or text.isspace():
             console.print("[red]Error:[/red] Text content is empty", style="bold")
             sys.exit(1)
 
@@ -100,20 +351,18 @@ def create(
                 sys.exit(1)
 
         # Parse sentences
-        console.print(f"[cyan]Parsing text into sentences...[/cyan]")
+        status.add(f"[cyan]Parsing text into sentences...[/cyan]")
         sentences = split_into_sentences(text)
-        console.print(f"[green]>[/green] Found {len(sentences)} sentences")
+        status.add(f"[green]>[/green] Found {len(sentences)} sentences")
 
         # Initialize managers
         ensure_directory(Path(db_path).parent)
-        metadata_mgr = MetadataManager(db_path)
-        doc_builder = DocumentBuilder()
-        track_injector = TrackChangesInjector()
+        metadata_mgr = _metadata_manager(db_path)
 
         # Create document in database
-        console.print(f"[cyan]Creating document metadata...[/cyan]")
+        status.add(f"[cyan]Creating document metadata...[/cyan]")
         doc = metadata_mgr.create_document(
-            filename=str(output),
+            filename=out_s,
             sentences=sentences,
             start_timestamp=start_timestamp,
             min_interval_seconds=min_interval,
@@ -121,59 +370,36 @@ def create(
             author=author,
             custom_last_edit_time=custom_last_edit_timestamp
         )
-        console.print(f"[green]>[/green] Metadata stored in database")
+        status.add(f"[green]>[/green] Metadata stored in database")
 
         # Build DOCX
-        console.print(f"[cyan]Building Word document...[/cyan]")
-        temp_path = str(output) + ".tmp"
-        doc_builder.create_document(
-            sentences=doc.sentences,
-            output_path=temp_path,
+        status.add(f"[cyan]Building Word document...[/cyan]")
+        mode = _build_mode(no_track_changes, accept_all_changes)
+        status.add(_BUILD_MODE_MESSAGES[mode])
+        _build_document(
+            doc.sentences,
+            out_s,
             author=author,
             title=title,
             subject=subject,
             keywords=keywords,
             comments=comments,
-            total_edit_minutes=total_edit_time
+            mode=mode
         )
 
-        if no_track_changes:
-            # Just use the clean document without track changes
-            console.print(f"[cyan]Creating clean document (no track changes)...[/cyan]")
-            Path(temp_path).rename(output)
-        elif accept_all_changes:
-            # Keep timestamps but show final text (not as suggestions)
-            console.print(f"[cyan]Creating document with timestamps (final text, not suggestions)...[/cyan]")
-            track_injector.inject_track_changes(
-                docx_path=temp_path,
-                sentences=doc.sentences,
-                output_path=str(output),
-                accept_changes=True
-            )
-            Path(temp_path).unlink(missing_ok=True)
-        else:
-            # Inject track changes (shows as suggestions)
-            console.print(f"[cyan]Injecting track changes (will show as suggestions)...[/cyan]")
-            track_injector.inject_track_changes(
-                docx_path=temp_path,
-                sentences=doc.sentences,
-                output_path=str(output),
-                accept_changes=False
-            )
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
-
         # Set total editing time if specified
         if total_edit_time and total_edit_time > 0:
-            console.print(f"[cyan]Setting total editing time...[/cyan]")
-            MetadataEditor.set_total_edit_time(str(output), total_edit_time)
+            status.add(f"[cyan]Setting total editing time...[/cyan]")
+            MetadataEditor.set_total_edit_time(out_s, total_edit_time)
 
-        console.print(f"\n[bold green]OK Document created successfully![/bold green]")
-        console.print(f"[dim]Output:[/dim] {output}")
-        console.print(f"[dim]Sentences:[/dim] {len(sentences)}")
-        console.print(f"[dim]Time range:[/dim] {doc.created_at.strftime('%Y-%m-%d %H:%M:%S')} -> {doc.last_modified.strftime('%Y-%m-%d %H:%M:%S')}")
+        status.add(f"\n[bold green]OK Document created successfully![/bold green]")
+        status.add(f"[dim]Output:[/dim] {output}")
+        status.add(f"[dim]Sentences:[/dim] {len(sentences)}")
+        status.add(f"[dim]Time range:[/dim] {doc.created_at.strftime('%Y-%m-%d %H:%M:%S')} -> {doc.last_modified.strftime('%Y-%m-%d %H:%M:%S')}")
+        status.flush()
 
     except Exception as e:
+        status.flush()
         console.print(f"\n[bold red]Error:[/bold red] {e}", style="bold")
         sys.exit(1)
 
@@ -190,6 +416,8 @@ def edit_timestamp(
     Example:
         dolos edit-timestamp document.docx --sentence 0 --timestamp "2025-01-15 14:30:00"
     """
+    status = _StatusBuffer(console)
+
     try:
         if not document.exists():
             console.print(f"[red]Error:[/red] Document not found: {document}", style="bold")
@@ -203,44 +431,28 @@ def edit_timestamp(
             sys.exit(1)
 
         # Update metadata
-        metadata_mgr = MetadataManager(db_path)
-        success = metadata_mgr.update_sentence_timestamp(
-            document_filename=str(document),
+        doc_s = os.fspath(document)
+        metadata_mgr = _metadata_manager(db_path)
+        doc = metadata_mgr.update_sentence_timestamp(
+            document_filename=doc_s,
             sentence_position=sentence,
             new_timestamp=new_timestamp
         )
 
-        if not success:
+        if doc is None:
             console.print(f"[red]Error:[/red] Could not update sentence {sentence}", style="bold")
             sys.exit(1)
 
         # Rebuild document with new timestamps
-        console.print(f"[cyan]Rebuilding document with new timestamp...[/cyan]")
-        doc = metadata_mgr.get_document_by_filename(str(document))
-
-        if doc:
-            doc_builder = DocumentBuilder()
-            track_injector = TrackChangesInjector()
-
-            temp_path = str(document) + ".tmp"
-            doc_builder.create_document(
-                sentences=doc.sentences,
-                output_path=temp_path,
-                author=doc.author
-            )
-
-            track_injector.inject_track_changes(
-                docx_path=temp_path,
-                sentences=doc.sentences,
-                output_path=str(document)
-            )
+        status.add(f"[cyan]Rebuilding document with new timestamp...[/cyan]")
+        _build_document(doc.sentences, doc_s, author=doc.author)
 
-            Path(temp_path).unlink(missing_ok=True)
-
-        console.print(f"[bold green]SUCCESS: Timestamp updated successfully![/bold green]")
-        console.print(f"[dim]Sentence {sentence}:[/dim] {new_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        status.add(f"[bold green]SUCCESS: Timestamp updated successfully![/bold green]")
+        status.add(f"[dim]Sentence {sentence}:[/dim] {new_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        status.flush()
 
     except Exception as e:
+        status.flush()
         console.print(f"\n[bold red]Error:[/bold red] {e}", style="bold")
         sys.exit(1)
 
@@ -259,6 +471,8 @@ def edit_metadata(
         dolos edit-metadata document.docx --author "John Doe" --created "2025-01-01 10:00:00"
         dolos edit-metadata document.docx --modified "2025-01-15 14:30:00" --total-edit-time 720
     """
+    from .metadata_editor import MetadataEditor
+
     try:
         if not document.exists():
             console.print(f"[red]Error:[/red] Document not found: {document}", style="bold")
@@ -290,7 +504,7 @@ def edit_metadata(
         # Apply metadata changes
         console.print(f"[cyan]Updating document metadata...[/cyan]")
         MetadataEditor.edit_metadata(
-            docx_path=str(document),
+            docx_path=os.fspath(document),
             author=author,
             created_time=created_dt,
             modified_time=modified_dt,
@@ -324,13 +538,15 @@ def view_metadata(
         dolos view-metadata document.docx
         dolos view-metadata document.docx --json metadata.json
     """
+    from rich.table import Table
+
     try:
         if not document.exists():
             console.print(f"[red]Error:[/red] Document not found: {document}", style="bold")
             sys.exit(1)
 
-        metadata_mgr = MetadataManager(db_path)
-        metadata = metadata_mgr.get_document_metadata(str(document))
+        metadata_mgr = _metadata_manager(db_path)
+        metadata = metadata_mgr.get_document_metadata(os.fspath(document))
 
         if not metadata:
             console.print(f"[yellow]Warning:[/yellow] No metadata found for {document}", style="bold")
@@ -338,8 +554,7 @@ def view_metadata(
 
         # Export to JSON if requested
         if export_json:
-            with open(export_json, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            _export_json(metadata, export_json)
             console.print(f"[green]>[/green] Metadata exported to {export_json}")
 
         # Display in terminal
@@ -357,14 +572,8 @@ def view_metadata(
         table.add_column("Created", style="cyan")
         table.add_column("Modified", style="green")
 
-        for sent in metadata['sentences']:
-            text_preview = sent['text'][:50] + "..." if len(sent['text']) > 50 else sent['text']
-            table.add_row(
-                str(sent['position']),
-                text_preview,
-                sent['created'],
-                sent['modified']
-            )
+        for row in _sentence_rows(metadata['sentences'], 'created', 'modified'):
+            table.add_row(*row)
 
         console.print(table)
 
@@ -386,6 +595,8 @@ def sanitize(
         dolos sanitize document.docx --output clean.docx
         dolos sanitize document.docx --neutral-date "2000-01-01 00:00:00"
     """
+    status = _StatusBuffer(console)
+
     try:
         if not document.exists():
             console.print(f"[red]Error:[/red] Document not found: {document}", style="bold")
@@ -402,21 +613,23 @@ def sanitize(
                 console.print(f"[red]Error:[/red] {e}", style="bold")
                 sys.exit(1)
 
-        console.print(f"[cyan]Sanitizing document...[/cyan]")
-        sanitizer = DocumentSanitizer()
+        status.add(f"[cyan]Sanitizing document...[/cyan]")
+        sanitizer = _sanitizer()
         sanitizer.sanitize_document(
-            input_path=str(document),
-            output_path=str(output_path),
+            input_path=os.fspath(document),
+            output_path=os.fspath(output_path),
             remove_track_changes=True,
             remove_metadata=True,
             neutral_timestamp=neutral_timestamp
         )
 
-        console.print(f"\n[bold green]OK Document sanitized successfully![/bold green]")
-        console.print(f"[dim]Output:[/dim] {output_path}")
-        console.print(f"[dim]Removed:[/dim] Track changes, metadata, revision history")
+        status.add(f"\n[bold green]OK Document sanitized successfully![/bold green]")
+        status.add(f"[dim]Output:[/dim] {output_path}")
+        status.add(f"[dim]Removed:[/dim] Track changes, metadata, revision history")
+        status.flush()
 
     except Exception as e:
+        status.flush()
         console.print(f"\n[bold red]Error:[/bold red] {e}", style="bold")
         sys.exit(1)
 
@@ -424,6 +637,9 @@ def sanitize(
 @app.command()
 def version():
     """Show version information."""
+    if not _TTY:
+        sys.stdout.write(f"Dolos version {__version__}\n")
+        return
     console.print(f"[bold cyan]Dolos[/bold cyan] version [green]{__version__}[/green]")
 
 
@@ -434,26 +650,27 @@ def get_multiline_input() -> str:
     console.print("[yellow]When done, type 'END' on a new line and press Enter[/yellow]\n")
 
     lines = []
-    while True:
-        try:
-            line = input()
+    try:
+        # Read straight from the buffered stream rather than one input() call per line;
+        # iteration stops at EOF (Ctrl+D / Ctrl+Z)
+        for line in sys.stdin:
+            line = line.rstrip('\r\n')
             # Check if user typed END to finish
             if line.strip().upper() == "END":
                 break
             lines.append(line)
-        except EOFError:
-            # Handle Ctrl+D / Ctrl+Z
-            break
-        except KeyboardInterrupt:
-            # Handle Ctrl+C
-            console.print("\n[yellow]Input cancelled[/yellow]")
-            return ""
+    except KeyboardInterrupt:
+        # Handle Ctrl+C
+        console.print("\n[yellow]Input cancelled[/yellow]")
+        return ""
 
     return "\n".join(lines)
 
 
 def interactive_create():
     """Interactive mode for creating documents."""
+    from .metadata_editor import MetadataEditor
+
     console.print(Panel.fit(
         "[bold cyan]Create Document with Custom Edit History[/bold cyan]\n"
         "Generate a Word document with fake revision timestamps",
@@ -477,9 +694,9 @@ def interactive_create():
         if not path.exists():
             console.print(f"[red]Error:[/red] File not found: {file_path}")
             return
-        text = path.read_text(encoding='utf-8')
+        text = _read_text_file(path)
 
-    if not text or not text.strip():
+    if not text or text.isspace():
         console.print("[red]Error:[/red] No text provided")
         return
 
@@ -583,9 +800,6 @@ def interactive_create():
     else:
         console.print("[dim]  -> Clean document, no track changes or timestamps[/dim]")
 
-    no_track_changes = (doc_mode == "clean")
-    accept_all_changes = (doc_mode == "final")
-
     # Get database path
     db_path = Prompt.ask("Database path", default="data/dolos.db")
 
@@ -597,12 +811,7 @@ def interactive_create():
     console.print(f"  Start: {start_timestamp or 'Current time'}")
     console.print(f"  Intervals: {min_interval}-{max_interval} seconds")
 
-    if no_track_changes:
-        console.print(f"  Mode: Clean document (no timestamps)")
-    elif accept_all_changes:
-        console.print(f"  Mode: Final text with timestamps")
-    else:
-        console.print(f"  Mode: Track changes (suggestions)")
+    console.print(f"  Mode: {_MODE_SUMMARIES[doc_mode]}")
 
     if title:
         console.print(f"  Title: {title}")
@@ -617,9 +826,7 @@ def interactive_create():
     # Create document
     try:
         ensure_directory(Path(db_path).parent)
-        metadata_mgr = MetadataManager(db_path)
-        doc_builder = DocumentBuilder()
-        track_injector = TrackChangesInjector()
+        metadata_mgr = _metadata_manager(db_path)
 
         console.print("\n[cyan]Creating document metadata...[/cyan]")
         doc = metadata_mgr.create_document(
@@ -633,40 +840,18 @@ def interactive_create():
         )
 
         console.print(f"[cyan]Building Word document...[/cyan]")
-        temp_path = str(output_path) + ".tmp"
-        doc_builder.create_document(
-            sentences=doc.sentences,
-            output_path=temp_path,
+        console.print(_BUILD_MODE_MESSAGES[doc_mode])
+        _build_document(
+            doc.sentences,
+            output_path,
             author=author,
             title=title,
             subject=subject,
             keywords=keywords,
             comments=comments,
-            total_edit_minutes=total_edit_time
+            mode=doc_mode
         )
 
-        if no_track_changes:
-            console.print(f"[cyan]Creating clean document (no track changes)...[/cyan]")
-            Path(temp_path).rename(output_path)
-        elif accept_all_changes:
-            console.print(f"[cyan]Creating document with timestamps (final text)...[/cyan]")
-            track_injector.inject_track_changes(
-                docx_path=temp_path,
-                sentences=doc.sentences,
-                output_path=output_path,
-                accept_changes=True
-            )
-            Path(temp_path).unlink(missing_ok=True)
-        else:
-            console.print(f"[cyan]Injecting track changes (suggestions)...[/cyan]")
-            track_injector.inject_track_changes(
-                docx_path=temp_path,
-                sentences=doc.sentences,
-                output_path=output_path,
-                accept_changes=False
-            )
-            Path(temp_path).unlink(missing_ok=True)
-
         # Set total editing time if specified
         if total_edit_time and total_edit_time > 0:
             console.print(f"[cyan]Setting total editing time...[/cyan]")
@@ -683,6 +868,8 @@ def interactive_create():
 
 def interactive_edit():
     """Interactive mode for editing timestamps."""
+    from rich.table import Table
+
     console.print(Panel.fit(
         "[bold cyan]Edit Sentence Timestamp[/bold cyan]\n"
         "Modify the timestamp for a specific sentence",
@@ -697,7 +884,7 @@ def interactive_edit():
 
     # Show current metadata
     db_path = Prompt.ask("Database path", default="data/dolos.db")
-    metadata_mgr = MetadataManager(db_path)
+    metadata_mgr = _metadata_manager(db_path)
     metadata = metadata_mgr.get_document_metadata(document_path)
 
     if not metadata:
@@ -711,13 +898,8 @@ def interactive_edit():
     table.add_column("Text", min_width=30)
     table.add_column("Timestamp", style="cyan")
 
-    for sent in metadata['sentences']:
-        text_preview = sent['text'][:50] + "..." if len(sent['text']) > 50 else sent['text']
-        table.add_row(
-            str(sent['position']),
-            text_preview,
-            sent['modified']
-        )
+    for row in _sentence_rows(metadata['sentences'], 'modified'):
+        table.add_row(*row)
 
     console.print(table)
 
@@ -754,35 +936,18 @@ def interactive_edit():
     # Update
     try:
         console.print("\n[cyan]Updating timestamp...[/cyan]")
-        success = metadata_mgr.update_sentence_timestamp(
+        doc = metadata_mgr.update_sentence_timestamp(
             document_filename=document_path,
             sentence_position=sentence_num,
             new_timestamp=new_timestamp
         )
 
-        if not success:
+        if doc is None:
             console.print(f"[red]Error:[/red] Could not update timestamp")
             return
 
         console.print(f"[cyan]Rebuilding document...[/cyan]")
-        doc = metadata_mgr.get_document_by_filename(document_path)
-        doc_builder = DocumentBuilder()
-        track_injector = TrackChangesInjector()
-
-        temp_path = str(document_path) + ".tmp"
-        doc_builder.create_document(
-            sentences=doc.sentences,
-            output_path=temp_path,
-            author=doc.author
-        )
-
-        track_injector.inject_track_changes(
-            docx_path=temp_path,
-            sentences=doc.sentences,
-            output_path=document_path
-        )
-
-        Path(temp_path).unlink(missing_ok=True)
+        _build_document(doc.sentences, document_path, author=doc.author)
 
         console.print(f"\n[bold green]SUCCESS: Timestamp updated successfully![/bold green]")
 
@@ -836,7 +1001,7 @@ def interactive_sanitize():
 
     try:
         console.print("\n[cyan]Sanitizing document...[/cyan]")
-        sanitizer = DocumentSanitizer()
+        sanitizer = _sanitizer()
         sanitizer.sanitize_document(
             input_path=document_path,
             output_path=output_path,
@@ -1,14 +1,249 @@
 """Document builder for creating DOCX files with track changes."""
 
+import io
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from os import PathLike
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
 
 from docx import Document as DocxDocument
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from .models import Document, Sentence
+from .xml_injector import TrackChangesInjector
+from ._xml_fast import _w3c_date, _xml_escape
+from ._zip_fast import _compress_type
+
+# Paragraph markup for one sentence: <w:p><w:r>run content</w:r>[space run]</w:p>
+_P_OPEN = b'<w:p><w:r>'
+_P_SPACE = b'</w:r><w:r><w:t xml:space="preserve"> </w:t>'
+_P_CLOSE = b'</w:r></w:p>'
+_T_OPEN = b'<w:t xml:space="preserve">'
+_T_CLOSE = b'</w:t>'
+
+# Characters python-docx's run.text turns into elements instead of text
+_RUN_BREAK_RE = re.compile(r'([\t\n\r])')
+_RUN_BREAKS = {'\t': b'<w:tab/>', '\n': b'<w:br/>', '\r': b'<w:br/>'}
+
+
+# Parts that differ between documents; everything else is python-docx's default template
+_VARIABLE_PARTS = frozenset({'docProps/core.xml', 'word/document.xml', 'word/settings.xml'})
+
+
+def _write_zip(parts: Dict[str, bytes], file, compresslevel: int = 1) -> None:
+    """Write DOCX parts to a new ZIP package.
+
+    Args:
+        parts: Mapping of archive member names to their bytes
+        file: Output path or binary file object
+        compresslevel: DEFLATE level for everything except [Content_Types].xml
+    """
+    with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+        # [Content_Types].xml first WITHOUT compression for Word compatibility
+        content_types = parts.get('[Content_Types].xml')
+        if content_types is not None:
+            zipf.writestr('[Content_Types].xml', content_types, compress_type=zipfile.ZIP_STORED)
+
+        for name, data in parts.items():
+            if name != '[Content_Types].xml':
+                zipf.writestr(name, data, compress_type=_compress_type(name))
+
+
+# Core properties part, mirroring python-docx's serialization of its default template
+_CORE_XML = (
+    b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+    b'<cp:coreProperties'
+    b' xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+    b' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+    b' xmlns:dcterms="http://purl.org/dc/terms/"'
+    b' xmlns:dcmitype="http://purl.org/dc/dcmitype/"'
+    b' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+    b'%s%s%s%s%s%s'
+    b'<cp:revision>1</cp:revision>'
+    b'<dcterms:created xsi:type="dcterms:W3CDTF">%s</dcterms:created>'
+    b'<dcterms:modified xsi:type="dcterms:W3CDTF">%s</dcterms:modified>'
+    b'<cp:category/></cp:coreProperties>'
+)
+
+# Values the default template carries when a property is not set
+_DEFAULT_DESCRIPTION = 'generated by python-docx'
+_DEFAULT_TIMESTAMP = b'2013-12-23T23:15:00Z'
+
+
+def _run_content(text: str) -> bytes:
+    """Emit the content of a run for text, the way python-docx's run.text does.
+
+    Tabs become <w:tab/> and each carriage return or newline becomes <w:br/>;
+    the text between them goes into <w:t> elements.
+
+    Args:
+        text: Raw sentence text
+
+    Returns:
+        Run content as UTF-8 bytes
+
+    Raises:
+        ValueError: If the text contains characters XML does not allow
+    """
+    if '\t' not in text and '\n' not in text and '\r' not in text:
+        return _T_OPEN + _xml_escape(text) + _T_CLOSE if text else b''
+
+    content = []
+    for piece in _RUN_BREAK_RE.split(text):
+        if piece in _RUN_BREAKS:
+            content.append(_RUN_BREAKS[piece])
+        elif piece:
+            content.append(_T_OPEN + _xml_escape(piece) + _T_CLOSE)
+    return b''.join(content)
+
+
+def _core_element(tag: bytes, value: Optional[str]) -> bytes:
+    """Emit a core property element, self-closing when empty.
+
+    Args:
+        tag: Qualified element name
+        value: Element text
+
+    Returns:
+        Element markup as UTF-8 bytes
+
+    Raises:
+        ValueError: If the value is longer than 255 characters, as python-docx enforces
+    """
+    if not value:
+        return b'<%s/>' % tag
+    if not isinstance(value, str):
+        value = str(value)
+    if len(value) > 255:
+        raise ValueError(f"exceeded 255 char limit for property, got:\n\n'{value}'")
+    return b'<%s>%s</%s>' % (tag, _xml_escape(value), tag)
+
+
+def _w3cdtf(value: Optional[datetime]) -> bytes:
+    """Format a timestamp the way python-docx writes core property dates."""
+    if value is None:
+        return _DEFAULT_TIMESTAMP
+    return _w3c_date(value)
+
+
+@lru_cache(maxsize=None)
+def _template_parts() -> Dict[str, bytes]:
+    """Load the python-docx default template parts once per process.
+
+    Returns:
+        Mapping of archive member names to their bytes, in package order
+    """
+    buffer = io.BytesIO()
+    DocxDocument().save(buffer)
+
+    with zipfile.ZipFile(buffer, 'r') as zip_ref:
+        return {name: zip_ref.read(name) for name in zip_ref.namelist()}
+
+
+@lru_cache(maxsize=None)
+def _document_skeleton() -> Tuple[bytes, bytes]:
+    """Split the template document.xml around the point where body paragraphs go.
+
+    Returns:
+        Tuple of (markup before the body paragraphs, markup after them)
+    """
+    document_xml = _template_parts()['word/document.xml']
+    # Paragraphs go before sectPr, which must stay last in the body
+    insert_at = document_xml.find(b'<w:sectPr')
+    if insert_at == -1:
+        insert_at = document_xml.rindex(b'</w:body>')
+    return document_xml[:insert_at], document_xml[insert_at:]
+
+
+@lru_cache(maxsize=None)
+def _static_package() -> Tuple[bytes, Dict[str, bytes]]:
+    """Compress the constant template parts once per process.
+
+    Returns:
+        Tuple of (ZIP bytes holding the static parts, mapping of static part names to bytes)
+    """
+    static_parts = {
+        name: data
+        for name, data in _template_parts().items()
+        if name not in _VARIABLE_PARTS
+    }
+
+    package = io.BytesIO()
+    _write_zip(static_parts, package, compresslevel=9)
+    return package.getvalue(), static_parts
+
+
+def _write_parts(parts: Dict[str, bytes], output_path: Union[str, BinaryIO]) -> None:
+    """Write in-memory DOCX parts to a ZIP package in a single pass.
+
+    Args:
+        parts: Mapping of archive member names to their bytes
+        output_path: Output DOCX path or binary file object
+    """
+    if not isinstance(output_path, (str, PathLike)):
+        _write_package(parts, output_path)
+        return
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        _write_package(parts, f)
+
+
+def _output_result(output_path: Union[str, BinaryIO]) -> Union[str, BinaryIO]:
+    """Return a written path as str, or the file object unchanged.
+
+    Args:
+        output_path: Output DOCX path or binary file object
+
+    Returns:
+        str(output_path) for paths, otherwise the file object itself
+    """
+    if isinstance(output_path, (str, PathLike)):
+        return str(output_path)
+    return output_path
+
+
+def _write_package(parts: Dict[str, bytes], file: BinaryIO) -> None:
+    """Write DOCX parts to a binary file object.
+
+    When the template parts are unchanged, their precompressed entries (with CRCs
+    and sizes already computed) are reused and only the variable parts are deflated.
+
+    Args:
+        parts: Mapping of archive member names to their bytes
+        file: Binary file object to write the package to
+    """
+    package, static_parts = _static_package()
+
+    if any(parts.get(name) != data for name, data in static_parts.items()):
+        _write_zip(parts, file)
+        return
+
+    buffer = io.BytesIO(package)
+    with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        for name, data in parts.items():
+            if name not in static_parts:
+                zipf.writestr(name, data)
+
+    file.write(buffer.getvalue())
+
+
+def _build_one(job: Dict[str, Any]) -> str:
+    """Build a single document in a worker process.
+
+    Args:
+        job: Keyword arguments for DocumentBuilder.create_document_with_track_changes
+
+    Returns:
+        Path to created document
+    """
+    return str(DocumentBuilder().create_document_with_track_changes(**job))
 
 
 class DocumentBuilder:
@@ -21,19 +256,19 @@ class DocumentBuilder:
     def create_document(
         self,
         sentences: List[Sentence],
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         author: str = "Dolos",
         title: Optional[str] = None,
         subject: Optional[str] = None,
         keywords: Optional[str] = None,
         comments: Optional[str] = None,
         total_edit_minutes: Optional[int] = None
-    ) -> str:
+    ) -> Union[str, BinaryIO]:
         """Create a DOCX document from sentences.
 
         Args:
             sentences: List of Sentence objects with metadata
-            output_path: Path to save the document
+            output_path: Path to save the document, or a binary file object
             author: Document author
             title: Document title
             subject: Document subject
@@ -42,72 +277,182 @@ class DocumentBuilder:
             total_edit_minutes: Total editing time in minutes
 
         Returns:
-            Path to created document
+            Path to created document, or the file object it was written to
         """
-        # Create new document
-        self.document = DocxDocument()
+        parts = self._build_parts(
+            sentences,
+            author=author,
+            title=title,
+            subject=subject,
+            keywords=keywords,
+            comments=comments
+        )
 
-        # Set core properties
-        core_props = self.document.core_properties
-        core_props.author = author
-        core_props.last_modified_by = author
+        # Save the document
+        _write_parts(parts, output_path)
 
-        if title:
-            core_props.title = title
+        return _output_result(output_path)
 
-        if subject:
-            core_props.subject = subject
+    def create_document_with_track_changes(
+        self,
+        sentences: List[Sentence],
+        output_path: Union[str, BinaryIO],
+        author: str = "Dolos",
+        title: Optional[str] = None,
+        subject: Optional[str] = None,
+        keywords: Optional[str] = None,
+        comments: Optional[str] = None,
+        accept_changes: bool = False,
+        injector: Optional[TrackChangesInjector] = None
+    ) -> Union[str, BinaryIO]:
+        """Create a DOCX document and inject track changes in a single pass.
 
-        if keywords:
-            core_props.keywords = keywords
+        Equivalent to create_document followed by TrackChangesInjector.inject_track_changes,
+        but the package parts stay in memory so the ZIP is only written once.
 
-        if comments:
-            core_props.comments = comments
+        Args:
+            sentences: List of Sentence objects with metadata
+            output_path: Path to save the document, or a binary file object
+            author: Document author
+            title: Document title
+            subject: Document subject
+            keywords: Document keywords/tags
+            comments: Document comments
+            accept_changes: If True, text is final (timestamps kept, no suggestions)
+            injector: Injector to use (a new one is created if None)
 
-        # Set timestamps from first and last sentence
-        if sentences:
-            core_props.created = sentences[0].created_timestamp
-            core_props.modified = sentences[-1].modified_timestamp
+        Returns:
+            Path to created document, or the file object it was written to
+        """
+        if injector is None:
+            injector = TrackChangesInjector()
 
-        # Note: Total editing time will be set via XML manipulation after document is saved
-        # python-docx doesn't expose this property directly
+        parts = self._build_parts(
+            sentences,
+            author=author,
+            title=title,
+            subject=subject,
+            keywords=keywords,
+            comments=comments,
+            include_body=False  # The injector writes the body itself
+        )
+        injector.inject_into_parts(parts, sentences, accept_changes=accept_changes)
 
-        # Add content (we'll inject track changes later via XML)
-        # For now, just add the sentences as regular paragraphs
-        for sentence in sentences:
-            paragraph = self.document.add_paragraph()
-            run = paragraph.add_run(sentence.sentence_text)
+        _write_parts(parts, output_path)
 
-            # Add space after each sentence except the last
-            if sentence != sentences[-1]:
-                paragraph.add_run(" ")
+        return _output_result(output_path)
 
-        # Save the document
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        self.document.save(str(output_path))
+    def create_documents(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """Create several documents in parallel across worker processes.
 
-        return str(output_path)
+        Each job is a dict of keyword arguments for create_document_with_track_changes.
+        Workers only build files and never open the metadata database, so no SQLite
+        connection is shared between processes.
+
+        Args:
+            jobs: Keyword arguments per document (output_path must be a filesystem path)
+            max_workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Paths to created documents, in job order
+        """
+        # A pool only pays off when there is more than one document to build
+        if len(jobs) < 2:
+            return [_build_one(job) for job in jobs]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_build_one, jobs))
+
+    def _build_parts(
+        self,
+        sentences: List[Sentence],
+        author: str = "Dolos",
+        title: Optional[str] = None,
+        subject: Optional[str] = None,
+        keywords: Optional[str] = None,
+        comments: Optional[str] = None,
+        include_body: bool = True
+    ) -> Dict[str, bytes]:
+        """Build the document package parts in memory from the cached template.
+
+        Args:
+            sentences: List of Sentence objects with metadata
+            author: Document author
+            title: Document title
+            subject: Document subject
+            keywords: Document keywords/tags
+            comments: Document comments
+            include_body: Whether to write the sentences as body paragraphs
+
+        Returns:
+            Mapping of archive member names to their bytes, in package order
+        """
+        parts = dict(_template_parts())
+
+        parts['docProps/core.xml'] = _CORE_XML % (
+            _core_element(b'dc:title', title),
+            _core_element(b'dc:subject', subject),
+            _core_element(b'dc:creator', author),
+            _core_element(b'cp:keywords', keywords),
+            _core_element(b'dc:description', comments or _DEFAULT_DESCRIPTION),
+            _core_element(b'cp:lastModifiedBy', author),
+            # Timestamps come from the first and last sentence
+            _w3cdtf(sentences[0].created_timestamp if sentences else None),
+            _w3cdtf(sentences[-1].modified_timestamp if sentences else None)
+        )
+
+        if include_body and sentences:
+            head, tail = _document_skeleton()
+            parts['word/document.xml'] = head + self._build_body(sentences) + tail
+
+        return parts
+
+    def _build_body(self, sentences: List[Sentence]) -> bytes:
+        """Emit the body paragraphs for a list of sentences as raw XML.
+
+        Args:
+            sentences: List of Sentence objects
+
+        Returns:
+            Concatenated <w:p> elements as UTF-8 bytes
+        """
+        writer = io.BytesIO()
+        write = writer.write
+        last_idx = len(sentences) - 1
+
+        for idx, sentence in enumerate(sentences):
+            write(_P_OPEN)
+            write(_run_content(sentence.sentence_text))
+            # Add space after each sentence except the last
+            if idx < last_idx:
+                write(_P_SPACE)
+            write(_P_CLOSE)
+
+        return writer.getvalue()
 
     def create_simple_document(
         self,
         text: str,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         author: str = "Dolos",
         created_time: Optional[datetime] = None,
         modified_time: Optional[datetime] = None
-    ) -> str:
+    ) -> Union[str, BinaryIO]:
         """Create a simple DOCX document without track changes.
 
         Args:
             text: Document text content
-            output_path: Path to save the document
+            output_path: Path to save the document, or a binary file object
             author: Document author
             created_time: Creation timestamp
             modified_time: Modification timestamp
 
         Returns:
-            Path to created document
+            Path to created document, or the file object it was written to
         """
         self.document = DocxDocument()
 
@@ -124,7 +469,11 @@ class DocumentBuilder:
         # Add content
         paragraph = self.document.add_paragraph(text)
 
-        # Save
+        # Save (python-docx writes to file objects directly)
+        if not isinstance(output_path, (str, PathLike)):
+            self.document.save(output_path)
+            return output_path
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         self.document.save(str(output_path))
@@ -1,12 +1,24 @@
 """Direct XML editing for advanced document properties."""
 
+import io
+import os
 import zipfile
-import tempfile
 from pathlib import Path
 from lxml import etree
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
+from ._zip_fast import _copy_entry
+
+CORE_XML = 'docProps/core.xml'
+APP_XML = 'docProps/app.xml'
+
+# Extended-properties namespace and Clark-notation tag names, built once
+_EP_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'
+_EP_PROPERTIES = f'{{{_EP_NS}}}Properties'
+_EP_APPLICATION = f'{{{_EP_NS}}}Application'
+_EP_TOTAL_TIME = f'{{{_EP_NS}}}TotalTime'
+
 
 class MetadataEditor:
     """Edit document metadata that python-docx doesn't expose."""
@@ -16,10 +28,17 @@ class MetadataEditor:
         'dc': 'http://purl.org/dc/elements/1.1/',
         'dcterms': 'http://purl.org/dc/terms/',
         'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
-        'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties',
+        'ep': _EP_NS,
         'vt': 'http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes'
     }
 
+    # Compiled once; each returns the matching elements for a parsed root
+    _XP_CREATOR = etree.XPath('.//dc:creator', namespaces=NAMESPACES)
+    _XP_LAST_MODIFIED_BY = etree.XPath('.//cp:lastModifiedBy', namespaces=NAMESPACES)
+    _XP_CREATED = etree.XPath('.//dcterms:created', namespaces=NAMESPACES)
+    _XP_MODIFIED = etree.XPath('.//dcterms:modified', namespaces=NAMESPACES)
+    _XP_TOTAL_TIME = etree.XPath('.//ep:TotalTime', namespaces=NAMESPACES)
+
     @staticmethod
     def set_total_edit_time(docx_path: str, minutes: int) -> None:
         """Set the total editing time in the document.
@@ -28,55 +47,48 @@ class MetadataEditor:
             docx_path: Path to DOCX file
             minutes: Total editing time in minutes
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract DOCX
-            with zipfile.ZipFile(docx_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Edit app.xml (Extended Properties)
-            app_xml_path = temp_path / 'docProps' / 'app.xml'
-            if not app_xml_path.exists():
-                # Create app.xml if it doesn't exist
-                MetadataEditor._create_app_xml(app_xml_path, minutes)
-            else:
-                # Update existing app.xml
-                tree = etree.parse(str(app_xml_path))
-                root = tree.getroot()
-
-                # Remove existing TotalTime element if present
-                for elem in root.findall('.//ep:TotalTime', namespaces=MetadataEditor.NAMESPACES):
-                    root.remove(elem)
-
-                # Add TotalTime element as simple integer value (in minutes)
-                total_time_elem = etree.Element(f"{{{MetadataEditor.NAMESPACES['ep']}}}TotalTime")
-                total_time_elem.text = str(minutes)
-                root.append(total_time_elem)
-
-                # Write modified XML
-                tree.write(
-                    str(app_xml_path),
-                    xml_declaration=True,
-                    encoding='UTF-8',
-                    standalone=True,
-                    pretty_print=False
-                )
-
-            # Repackage DOCX
-            MetadataEditor._zip_directory(temp_path, docx_path)
+        MetadataEditor.edit_metadata(docx_path, total_edit_minutes=minutes)
 
     @staticmethod
-    def _create_app_xml(app_xml_path: Path, minutes: int) -> None:
+    def _app_xml_with_total_time(zin: zipfile.ZipFile, minutes: int) -> bytes:
+        """Serialize app.xml with its TotalTime set.
+
+        Args:
+            zin: Open source DOCX
+            minutes: Total editing time in minutes
+
+        Returns:
+            app.xml bytes, created from scratch if the package has none
+        """
+        if APP_XML not in zin.NameToInfo:
+            return MetadataEditor._create_app_xml(minutes)
+
+        root = etree.fromstring(zin.read(APP_XML))
+
+        # Remove existing TotalTime element if present
+        for elem in MetadataEditor._XP_TOTAL_TIME(root):
+            elem.getparent().remove(elem)
+
+        # Add TotalTime element as simple integer value (in minutes)
+        total_time_elem = etree.Element(_EP_TOTAL_TIME)
+        total_time_elem.text = str(minutes)
+        root.append(total_time_elem)
+
+        return MetadataEditor._serialize(root)
+
+    @staticmethod
+    def _create_app_xml(minutes: int) -> bytes:
         """Create a minimal app.xml with TotalTime.
 
         Args:
-            app_xml_path: Path to create app.xml
             minutes: Total editing time in minutes
+
+        Returns:
+            Serialized app.xml
         """
         # Create root element with proper namespaces
         root = etree.Element(
-            f"{{{MetadataEditor.NAMESPACES['ep']}}}Properties",
+            _EP_PROPERTIES,
             nsmap={
                 None: MetadataEditor.NAMESPACES['ep'],
                 'vt': MetadataEditor.NAMESPACES['vt']
@@ -84,23 +96,14 @@ class MetadataEditor:
         )
 
         # Add Application element
-        app_elem = etree.SubElement(root, f"{{{MetadataEditor.NAMESPACES['ep']}}}Application")
+        app_elem = etree.SubElement(root, _EP_APPLICATION)
         app_elem.text = "Microsoft Office Word"
 
         # Add TotalTime element
-        total_time_elem = etree.SubElement(root, f"{{{MetadataEditor.NAMESPACES['ep']}}}TotalTime")
+        total_time_elem = etree.SubElement(root, _EP_TOTAL_TIME)
         total_time_elem.text = str(minutes)
 
-        # Write XML
-        tree = etree.ElementTree(root)
-        app_xml_path.parent.mkdir(parents=True, exist_ok=True)
-        tree.write(
-            str(app_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
+        return MetadataEditor._serialize(root)
 
     @staticmethod
     def edit_metadata(
@@ -119,105 +122,109 @@ class MetadataEditor:
             modified_time: Last modified timestamp
             total_edit_minutes: Total editing time in minutes
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if not (author or created_time or modified_time) and total_edit_minutes is None:
+            return
 
-            # Extract DOCX
-            with zipfile.ZipFile(docx_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
+        with zipfile.ZipFile(docx_path, 'r') as zin:
+            patches = {}
 
             # Edit core.xml (Core Properties)
-            if author or created_time or modified_time:
-                core_xml_path = temp_path / 'docProps' / 'core.xml'
-                if core_xml_path.exists():
-                    tree = etree.parse(str(core_xml_path))
-                    root = tree.getroot()
-
-                    # Update author
-                    if author:
-                        # Update dc:creator (original author)
-                        for elem in root.findall('.//dc:creator', namespaces=MetadataEditor.NAMESPACES):
-                            elem.text = author
-
-                        # Update cp:lastModifiedBy
-                        for elem in root.findall('.//cp:lastModifiedBy', namespaces=MetadataEditor.NAMESPACES):
-                            elem.text = author
-
-                    # Update creation time
-                    if created_time:
-                        for elem in root.findall('.//dcterms:created', namespaces=MetadataEditor.NAMESPACES):
-                            elem.text = created_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-
-                    # Update last modified time
-                    if modified_time:
-                        for elem in root.findall('.//dcterms:modified', namespaces=MetadataEditor.NAMESPACES):
-                            elem.text = modified_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-
-                    # Write modified XML
-                    tree.write(
-                        str(core_xml_path),
-                        xml_declaration=True,
-                        encoding='UTF-8',
-                        standalone=True,
-                        pretty_print=False
-                    )
+            if (author or created_time or modified_time) and CORE_XML in zin.NameToInfo:
+                root = etree.fromstring(zin.read(CORE_XML))
+
+                # Update author
+                if author:
+                    # Update dc:creator (original author)
+                    for elem in MetadataEditor._XP_CREATOR(root):
+                        elem.text = author
+
+                    # Update cp:lastModifiedBy
+                    for elem in MetadataEditor._XP_LAST_MODIFIED_BY(root):
+                        elem.text = author
+
+                # Update creation time
+                if created_time:
+                    for elem in MetadataEditor._XP_CREATED(root):
+                        elem.text = created_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+                # Update last modified time
+                if modified_time:
+                    for elem in MetadataEditor._XP_MODIFIED(root):
+                        elem.text = modified_time.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+                patches[CORE_XML] = MetadataEditor._serialize(root)
 
             # Edit app.xml (Extended Properties) for total edit time
             if total_edit_minutes is not None:
-                app_xml_path = temp_path / 'docProps' / 'app.xml'
-                if not app_xml_path.exists():
-                    MetadataEditor._create_app_xml(app_xml_path, total_edit_minutes)
+                patches[APP_XML] = MetadataEditor._app_xml_with_total_time(zin, total_edit_minutes)
+
+            # Drop parts that came out byte-identical; skip the rewrite if none changed
+            patches = {
+                name: data for name, data in patches.items()
+                if name not in zin.NameToInfo or zin.read(name) != data
+            }
+            if not patches:
+                return
+
+            package = MetadataEditor._repack(zin, patches)
+
+        MetadataEditor._replace_file(docx_path, package)
+
+    @staticmethod
+    def _serialize(root) -> bytes:
+        """Serialize a property part root to bytes with the standard DOCX declaration.
+
+        Args:
+            root: Root element
+
+        Returns:
+            Serialized XML bytes
+        """
+        return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    @staticmethod
+    def _repack(zin: zipfile.ZipFile, patches: Dict[str, bytes]) -> bytes:
+        """Build a new package in memory, replacing only the patched parts.
+
+        Untouched entries are copied byte for byte, keeping their original
+        order, timestamps and compression; parts missing from the source are
+        appended.
+
+        Args:
+            zin: Open source DOCX
+            patches: Replacement bytes keyed by part name
+
+        Returns:
+            New DOCX bytes
+        """
+        remaining = dict(patches)
+        buffer = io.BytesIO()
+
+        # Level 1 (Z_BEST_SPEED): near-identical size for XML at a fraction of the CPU
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zout:
+            for zinfo in zin.infolist():
+                data = remaining.pop(zinfo.filename, None)
+                if data is None:
+                    # Untouched parts are copied still compressed
+                    _copy_entry(zin, zout, zinfo)
                 else:
-                    tree = etree.parse(str(app_xml_path))
-                    root = tree.getroot()
-
-                    # Remove existing TotalTime element if present
-                    for elem in root.findall('.//ep:TotalTime', namespaces=MetadataEditor.NAMESPACES):
-                        root.remove(elem)
-
-                    # Add TotalTime element
-                    total_time_elem = etree.Element(f"{{{MetadataEditor.NAMESPACES['ep']}}}TotalTime")
-                    total_time_elem.text = str(total_edit_minutes)
-                    root.append(total_time_elem)
-
-                    # Write modified XML
-                    tree.write(
-                        str(app_xml_path),
-                        xml_declaration=True,
-                        encoding='UTF-8',
-                        standalone=True,
-                        pretty_print=False
-                    )
-
-            # Repackage DOCX
-            MetadataEditor._zip_directory(temp_path, docx_path)
+                    # A copied ZipInfo carries no level of its own, so pass it explicitly
+                    zout.writestr(zinfo, data, compresslevel=1)
+
+            for name, data in remaining.items():
+                zout.writestr(name, data)
+
+        return buffer.getvalue()
 
     @staticmethod
-    def _zip_directory(directory: Path, output_path: str):
-        """Zip directory to create DOCX.
+    def _replace_file(docx_path: str, package: bytes) -> None:
+        """Atomically replace a file with new contents.
 
         Args:
-            directory: Directory to zip
-            output_path: Output path
+            docx_path: Path to replace
+            package: New file contents
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add [Content_Types].xml first WITHOUT compression for Word compatibility
-            content_types = directory / '[Content_Types].xml'
-            if content_types.exists():
-                zipf.write(content_types, '[Content_Types].xml', compress_type=zipfile.ZIP_STORED)
-
-            # Add _rels/.rels second
-            rels_file = directory / '_rels' / '.rels'
-            if rels_file.exists():
-                zipf.write(rels_file, '_rels/.rels')
-
-            # Add all other files
-            for file_path in sorted(directory.rglob('*')):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(directory)
-                    # Skip files we already added
-                    if str(arcname) not in ('[Content_Types].xml', '_rels/.rels'):
-                        zipf.write(file_path, arcname)
+        path = Path(docx_path)
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_bytes(package)
+        os.replace(temp_path, path)
@@ -1,12 +1,26 @@
 """Metadata management for documents and sentences."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .models import Document, Sentence, DatabaseManager
+from .utils import generate_timestamps
+
+
+@lru_cache(maxsize=4096)
+def _iso(timestamp: datetime) -> str:
+    """Format a timestamp as ISO 8601, memoized.
+
+    A sentence's created and modified timestamps are usually equal, so the
+    second lookup per row is a cache hit.
+    """
+    return timestamp.isoformat()
 
 
 class MetadataManager:
@@ -48,7 +62,8 @@ class MetadataManager:
         Raises:
             ValueError: If custom_last_edit_time is earlier than minimum allowed time
         """
-        session = self.db_manager.get_session()
+        # Attributes stay loaded after commit, so the document is returned without a reload
+        session = self.db_manager.get_session(expire_on_commit=False)
 
         try:
             # Use current time if no start timestamp provided
@@ -73,93 +88,68 @@ class MetadataManager:
                             f"({num_sentences - 1} intervals × {min_interval_seconds}s)"
                         )
 
+            # Generate all sentence timestamps up front with randomized intervals
+            timestamps = generate_timestamps(
+                start_timestamp,
+                len(sentences),
+                min_interval_seconds,
+                max_interval_seconds
+            ) if sentences else []
+            current_timestamp = timestamps[-1] if timestamps else start_timestamp
+
+            # Use custom_last_edit_time if provided, otherwise use last sentence's timestamp.
+            # Known before the INSERT, so the transaction needs no follow-up UPDATE.
+            last_modified = custom_last_edit_time if custom_last_edit_time is not None else current_timestamp
+
             # Create document
             doc = Document(
                 filename=filename,
                 created_at=start_timestamp,
-                last_modified=start_timestamp,
+                last_modified=last_modified,
                 author=author,
                 last_modified_by=author
             )
             session.add(doc)
             session.flush()  # Get document ID
 
-            # Create sentences with randomized intervals
-            current_timestamp = start_timestamp
-            last_sentence = None
-            for idx, sentence_text in enumerate(sentences):
-                sentence = Sentence(
-                    document_id=doc.id,
-                    sentence_text=sentence_text,
-                    position=idx,
-                    created_timestamp=current_timestamp,
-                    modified_timestamp=current_timestamp,
-                    author=author,
-                    revision_id=idx + 1
-                )
-                session.add(sentence)
-                last_sentence = sentence  # Keep reference to last sentence
-
-                # Generate random interval for next sentence
-                if idx < len(sentences) - 1:  # Don't increment after last sentence
-                    import random
-                    from datetime import timedelta
-                    interval = random.randint(min_interval_seconds, max_interval_seconds)
-                    current_timestamp = current_timestamp + timedelta(seconds=interval)
-
-            # Update document last_modified
-            # Use custom_last_edit_time if provided, otherwise use last sentence's timestamp
-            if custom_last_edit_time is not None:
-                doc.last_modified = custom_last_edit_time
-                # Also update the last sentence's timestamp to match
-                if last_sentence:
-                    last_sentence.modified_timestamp = custom_last_edit_time
-            else:
-                doc.last_modified = current_timestamp
+            # Build sentence rows
+            sentence_rows = [
+                {
+                    'document_id': doc.id,
+                    'sentence_text': sentence_text,
+                    'position': idx,
+                    'created_timestamp': timestamp,
+                    'modified_timestamp': timestamp,
+                    'author': author,
+                    'revision_id': idx + 1
+                }
+                for idx, (sentence_text, timestamp) in enumerate(zip(sentences, timestamps))
+            ]
+
+            # A custom last edit time also applies to the last sentence
+            if custom_last_edit_time is not None and sentence_rows:
+                sentence_rows[-1]['modified_timestamp'] = custom_last_edit_time
+
+            # Insert all sentences in one executemany within the same transaction
+            if sentence_rows:
+                session.execute(insert(Sentence), sentence_rows)
+
+                # Only the generated ids are read back (served by the position index alone)
+                sentence_ids = session.scalars(
+                    select(Sentence.id)
+                    .where(Sentence.document_id == doc.id)
+                    .order_by(Sentence.position)
+                ).all()
+                for row, sentence_id in zip(sentence_rows, sentence_ids):
+                    row['id'] = sentence_id
 
             session.commit()
 
-            # Eagerly load all sentences and their attributes before closing session
-            doc_id = doc.id
-            doc_filename = doc.filename
-            doc_created = doc.created_at
-            doc_modified = doc.last_modified
-            doc_author = doc.author
-            doc_last_modified_by = doc.last_modified_by
-
-            # Load all sentences into memory
-            sentences_data = []
-            for sent in doc.sentences:
-                sentences_data.append({
-                    'id': sent.id,
-                    'document_id': sent.document_id,
-                    'sentence_text': sent.sentence_text,
-                    'position': sent.position,
-                    'created_timestamp': sent.created_timestamp,
-                    'modified_timestamp': sent.modified_timestamp,
-                    'author': sent.author,
-                    'revision_id': sent.revision_id
-                })
-
+            # Fill the collection from the rows just written, marked as already loaded
+            set_committed_value(doc, 'sentences', [Sentence(**row) for row in sentence_rows])
             session.close()
 
-            # Create new detached objects
-            new_doc = Document(
-                filename=doc_filename,
-                created_at=doc_created,
-                last_modified=doc_modified,
-                author=doc_author,
-                last_modified_by=doc_last_modified_by
-            )
-            new_doc.id = doc_id
-
-            # Recreate sentences
-            new_doc.sentences = []
-            for sdata in sentences_data:
-                sent_obj = Sentence(**sdata)
-                new_doc.sentences.append(sent_obj)
-
-            return new_doc
+            return doc
 
         except Exception as e:
             session.rollback()
@@ -177,11 +167,13 @@ class MetadataManager:
         """
         session = self.db_manager.get_session()
         try:
-            doc = session.query(Document).filter(Document.filename == filename).first()
-            if doc:
-                # Eagerly load sentences
-                _ = doc.sentences
-            return doc
+            # Sentences are loaded by the same query through a LEFT OUTER JOIN
+            return (
+                session.query(Document)
+                .options(joinedload(Document.sentences))
+                .filter(Document.filename == filename)
+                .first()
+            )
         finally:
             session.close()
 
@@ -196,10 +188,12 @@ class MetadataManager:
         """
         session = self.db_manager.get_session()
         try:
-            doc = session.query(Document).filter(Document.id == doc_id).first()
-            if doc:
-                _ = doc.sentences
-            return doc
+            return (
+                session.query(Document)
+                .options(joinedload(Document.sentences))
+                .filter(Document.id == doc_id)
+                .first()
+            )
         finally:
             session.close()
 
@@ -208,7 +202,7 @@ class MetadataManager:
         document_filename: str,
         sentence_position: int,
         new_timestamp: datetime
-    ) -> bool:
+    ) -> Optional[Document]:
         """Update timestamp for a specific sentence.
 
         Args:
@@ -217,36 +211,35 @@ class MetadataManager:
             new_timestamp: New timestamp
 
         Returns:
-            True if successful, False otherwise
+            The updated Document with its sentences loaded, or None if the update failed
         """
-        session = self.db_manager.get_session()
+        # Keep loaded state after commit so the document can be returned detached
+        session = self.db_manager.get_session(expire_on_commit=False)
 
         try:
             doc = session.query(Document).filter(Document.filename == document_filename).first()
             if not doc:
-                return False
+                return None
 
-            sentence = (
-                session.query(Sentence)
-                .filter(Sentence.document_id == doc.id, Sentence.position == sentence_position)
-                .first()
-            )
+            # Load all sentences once; they are returned to the caller for the rebuild
+            sentences = doc.sentences
+            sentence = next((s for s in sentences if s.position == sentence_position), None)
 
             if not sentence:
-                return False
+                return None
 
             sentence.modified_timestamp = new_timestamp
 
             # Update document's last_modified if this is the latest sentence
-            if sentence_position == len(doc.sentences) - 1:
+            if sentence_position == len(sentences) - 1:
                 doc.last_modified = new_timestamp
 
             session.commit()
-            return True
+            return doc
 
         except Exception:
             session.rollback()
-            return False
+            return None
         finally:
             session.close()
 
@@ -259,33 +252,60 @@ class MetadataManager:
         Returns:
             Dictionary with document and sentence metadata
         """
-        doc = self.get_document_by_filename(filename)
-        if not doc:
-            return None
+        session = self.db_manager.get_session()
+        try:
+            doc = session.execute(
+                select(
+                    Document.id,
+                    Document.filename,
+                    Document.created_at,
+                    Document.last_modified,
+                    Document.author,
+                    Document.last_modified_by
+                )
+                .where(Document.filename == filename)
+                .limit(1)
+            ).first()
+            if doc is None:
+                return None
+
+            # Fetch plain column tuples in one ordered query instead of hydrating ORM objects
+            rows = session.execute(
+                select(
+                    Sentence.position,
+                    Sentence.sentence_text,
+                    Sentence.created_timestamp,
+                    Sentence.modified_timestamp,
+                    Sentence.author,
+                    Sentence.revision_id
+                )
+                .where(Sentence.document_id == doc.id)
+                .order_by(Sentence.position)
+            ).all()
+        finally:
+            session.close()
 
-        metadata = {
+        return {
             "id": doc.id,
             "filename": doc.filename,
-            "created_at": doc.created_at.isoformat(),
-            "last_modified": doc.last_modified.isoformat(),
+            "created_at": _iso(doc.created_at),
+            "last_modified": _iso(doc.last_modified),
             "author": doc.author,
             "last_modified_by": doc.last_modified_by,
-            "sentence_count": len(doc.sentences),
-            "sentences": []
+            "sentence_count": len(rows),
+            "sentences": [
+                {
+                    "position": position,
+                    "text": text,
+                    "created": _iso(created),
+                    "modified": _iso(modified),
+                    "author": author,
+                    "revision_id": revision_id
+                }
+                for position, text, created, modified, author, revision_id in rows
+            ]
         }
 
-        for sentence in doc.sentences:
-            metadata["sentences"].append({
-                "position": sentence.position,
-                "text": sentence.sentence_text,
-                "created": sentence.created_timestamp.isoformat(),
-                "modified": sentence.modified_timestamp.isoformat(),
-                "author": sentence.author,
-                "revision_id": sentence.revision_id
-            })
-
-        return metadata
-
     def delete_document(self, filename: str) -> bool:
         """Delete a document and all its sentences.
 
@@ -1,9 +1,12 @@
 """SQLAlchemy models for metadata storage."""
 
+import atexit
+import os
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, create_engine
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, Text, create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 
@@ -14,6 +17,10 @@ class Document(Base):
     """Represents a Word document with metadata."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Every lookup goes through the filename
+        Index("idx_documents_filename", "filename"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     filename = Column(String(500), nullable=False)
@@ -23,7 +30,12 @@ class Document(Base):
     last_modified_by = Column(String(200), default="Dolos")
 
     # Relationship to sentences
-    sentences = relationship("Sentence", back_populates="document", cascade="all, delete-orphan")
+    sentences = relationship(
+        "Sentence",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        order_by="Sentence.position"
+    )
 
     def __repr__(self):
         return f"<Document(id={self.id}, filename='{self.filename}')>"
@@ -33,6 +45,11 @@ class Sentence(Base):
     """Represents a sentence within a document with its metadata."""
 
     __tablename__ = "sentences"
+    __table_args__ = (
+        # Sentences are always read per document in position order; the index
+        # serves both the filter and the ORDER BY without a temp sort
+        Index("idx_sentences_doc_pos", "document_id", "position"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
@@ -50,6 +67,92 @@ class Sentence(Base):
         return f"<Sentence(id={self.id}, position={self.position}, text='{self.sentence_text[:30]}...')>"
 
 
+# SQLite tuning applied to every new connection
+SQLITE_PRAGMAS = (
+    "PRAGMA page_size=8192",  # Only takes effect before the first table is created
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# One engine (and connection pool) per database file, shared by all managers
+_ENGINES: Dict[str, Engine] = {}
+
+# Session factories bound to those engines, so managers do not rebuild them
+_SESSION_FACTORIES: Dict[Engine, sessionmaker] = {}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _create_engine(db_path: str) -> Engine:
+    """Create an engine for a database path with the SQLite PRAGMAs applied."""
+    engine = create_engine(f"sqlite:///{db_path}")
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def get_engine(db_path: str) -> Engine:
+    """Get the shared engine for a database path, creating it on first use.
+
+    In-memory databases are never shared: each call gets its own engine, so
+    separate managers stay isolated.
+
+    Args:
+        db_path: Path to SQLite database file, or ":memory:"
+
+    Returns:
+        SQLAlchemy engine
+    """
+    if db_path == ":memory:":
+        return _create_engine(db_path)
+
+    key = os.path.abspath(db_path)
+    engine = _ENGINES.get(key)
+    if engine is None:
+        engine = _create_engine(db_path)
+        _ENGINES[key] = engine
+    return engine
+
+
+def get_session_factory(engine: Engine) -> sessionmaker:
+    """Get the shared session factory for an engine, creating it on first use.
+
+    Factories are only cached for shared file engines; a private in-memory
+    engine gets a fresh one that goes away with its manager.
+
+    Args:
+        engine: Engine returned by get_engine
+
+    Returns:
+        Session factory bound to the engine
+    """
+    factory = _SESSION_FACTORIES.get(engine)
+    if factory is None:
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        if engine in _ENGINES.values():
+            _SESSION_FACTORIES[engine] = factory
+    return factory
+
+
+@atexit.register
+def _dispose_engines():
+    """Close pooled connections when the interpreter exits."""
+    for engine in _ENGINES.values():
+        engine.dispose()
+    _ENGINES.clear()
+    _SESSION_FACTORIES.clear()
+
+
 class DatabaseManager:
     """Manages database connections and sessions."""
 
@@ -60,20 +163,28 @@ class DatabaseManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}")
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.engine = get_engine(db_path)
+        self.SessionLocal = get_session_factory(self.engine)
 
     def create_tables(self):
         """Create all tables in the database."""
         Base.metadata.create_all(bind=self.engine)
 
-    def get_session(self):
+        # create_all only indexes tables it creates; add indexes missing from older databases
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+
+    def get_session(self, expire_on_commit: bool = True):
         """Get a new database session.
 
+        Args:
+            expire_on_commit: Whether loaded objects are expired on commit
+
         Returns:
             SQLAlchemy session
         """
-        return self.SessionLocal()
+        return self.SessionLocal(expire_on_commit=expire_on_commit)
 
     def drop_tables(self):
         """Drop all tables (use with caution!)."""
@@ -1,14 +1,74 @@
 """Document sanitizer for removing metadata and track changes."""
 
+import io
+import re
 import zipfile
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from lxml import etree
 from docx import Document as DocxDocument
 
+from ._xml_fast import _TRACK_REVISIONS_RE, _W_PREFIX_DECL
+from ._zip_fast import _copy_entry
+
+_NAMESPACES = {
+    'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+    'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
+    'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'
+}
+
+# Compiled once; each returns the list of matches for a parsed root
+_REVISIONS_XP = etree.XPath(
+    './/w:ins | .//w:del | .//w:moveFrom | .//w:moveTo | .//w:rPrChange | .//w:pPrChange',
+    namespaces=_NAMESPACES
+)
+_TRACK_REVISIONS_XP = etree.XPath('.//w:trackRevisions', namespaces=_NAMESPACES)
+
+# Insertions are unwrapped; every other revision element is dropped with its content
+_W_INS = '{%s}ins' % _NAMESPACES['w']
+
+# Any revision element, whatever its prefix; \b keeps w:delText, w:insideH etc. from matching
+_REVISION_TAG_RE = re.compile(rb'<(?:\w+:)?(?:ins|del|moveFrom|moveTo|rPrChange|pPrChange)\b')
+
+# Core properties to neutralize, with their replacement text
+_CORE_PROPERTIES_TO_CLEAR = [
+    (etree.XPath(f'.//{prop_name}', namespaces=_NAMESPACES), default_value)
+    for prop_name, default_value in [
+        ('dc:creator', 'Anonymous'),
+        ('dc:title', ''),
+        ('dc:subject', ''),
+        ('dc:description', ''),
+        ('cp:lastModifiedBy', 'Anonymous'),
+        ('cp:revision', '1'),
+        ('cp:keywords', '')
+    ]
+]
+_CORE_TIMESTAMPS_XP = etree.XPath('.//dcterms:created | .//dcterms:modified', namespaces=_NAMESPACES)
+
+# Extended (app.xml) properties to clear
+_APP_PROPERTIES_XP = [
+    etree.XPath(f'.//ep:{prop_name}', namespaces=_NAMESPACES)
+    for prop_name in ['Company', 'Manager', 'AppVersion', 'Application']
+]
+
+
+def _sanitize_one(job: Dict[str, Any]) -> str:
+    """Sanitize a single document in a worker process.
+
+    Args:
+        job: Keyword arguments for DocumentSanitizer.sanitize_document
+
+    Returns:
+        Path to sanitized document
+    """
+    return DocumentSanitizer().sanitize_document(**job)
+
 
 class DocumentSanitizer:
     """Sanitize Word documents by removing metadata and revision history."""
@@ -48,192 +108,169 @@ class DocumentSanitizer:
         if neutral_timestamp is None:
             neutral_timestamp = datetime(2000, 1, 1, 0, 0, 0)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Byte-level edits take and return raw part bytes; tree edits mutate a parsed root
+        byte_edits = {}
+        tree_edits = {}
+        if remove_track_changes:
+            tree_edits['word/document.xml'] = self._remove_track_changes
+            byte_edits['word/settings.xml'] = self._disable_track_changes_in_settings
+        if remove_metadata:
+            tree_edits['docProps/core.xml'] = lambda root: self._sanitize_metadata(root, neutral_timestamp)
+            tree_edits['docProps/app.xml'] = self._sanitize_app_properties
+
+        # Hold the source in memory so it can be overwritten in place
+        source = io.BytesIO(Path(input_path).read_bytes())
+
+        with zipfile.ZipFile(source, 'r') as zin:
+            patches = {}
+            for name, edit in byte_edits.items():
+                if name in zin.NameToInfo:
+                    data = zin.read(name)
+                    patched = edit(data)
+                    if patched != data:
+                        patches[name] = patched
+
+            for name, edit in tree_edits.items():
+                if name not in zin.NameToInfo:
+                    continue
+
+                data = zin.read(name)
+                # A body without revisions is copied as-is instead of being parsed into a tree
+                if name == 'word/document.xml' and not _REVISION_TAG_RE.search(data):
+                    continue
+
+                root = etree.fromstring(data)
+                edit(root)
+                patches[name] = self._serialize(root)
+
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+
+            with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zout:
+                for info in zin.infolist():
+                    data = patches.get(info.filename)
+                    if data is None:
+                        # Untouched parts are copied still compressed
+                        _copy_entry(zin, zout, info)
+                    else:
+                        zout.writestr(info, data, compresslevel=1)
 
-            # Extract DOCX
-            with zipfile.ZipFile(input_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
+        return output_path
 
-            if remove_track_changes:
-                self._remove_track_changes(temp_path / 'word' / 'document.xml')
-                self._disable_track_changes(temp_path / 'word' / 'settings.xml')
+    def sanitize_documents(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """Sanitize several documents in parallel across worker processes.
 
-            if remove_metadata:
-                self._sanitize_metadata(
-                    temp_path / 'docProps' / 'core.xml',
-                    neutral_timestamp
-                )
-                self._sanitize_app_properties(temp_path / 'docProps' / 'app.xml')
+        Each job is a dict of keyword arguments for sanitize_document. Processes
+        are used rather than threads because lxml holds the GIL while serializing.
 
-            # Repackage
-            self._zip_directory(temp_path, output_path)
+        Args:
+            jobs: Keyword arguments per document
+            max_workers: Number of worker processes (defaults to the CPU count)
 
-        return output_path
+        Returns:
+            Paths to sanitized documents, in job order
+        """
+        # A pool only pays off when there is more than one document to sanitize
+        if len(jobs) < 2:
+            return [_sanitize_one(job) for job in jobs]
 
-    def _remove_track_changes(self, doc_xml_path: Path):
-        """Remove track changes from document.xml.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_sanitize_one, jobs, chunksize=4))
+
+    def _serialize(self, root) -> bytes:
+        """Serialize an XML root to bytes with the standard DOCX declaration.
 
         Args:
-            doc_xml_path: Path to document.xml
+            root: Root element
+
+        Returns:
+            Serialized XML bytes
         """
-        if not doc_xml_path.exists():
-            return
-
-        tree = etree.parse(str(doc_xml_path))
-        root = tree.getroot()
-
-        # Find all insertions and deletions
-        for ins in root.findall('.//w:ins', namespaces=self.NAMESPACES):
-            # Move content out of insertion tag
-            parent = ins.getparent()
-            index = parent.index(ins)
-
-            # Move all children to parent
-            for child in ins:
-                parent.insert(index, child)
-                index += 1
-
-            # Remove the ins tag
-            parent.remove(ins)
-
-        # Remove deletions entirely
-        for dele in root.findall('.//w:del', namespaces=self.NAMESPACES):
-            parent = dele.getparent()
-            parent.remove(dele)
-
-        # Remove other revision marks
-        for elem_name in ['w:moveFrom', 'w:moveTo', 'w:rPrChange', 'w:pPrChange']:
-            for elem in root.findall(f'.//{elem_name}', namespaces=self.NAMESPACES):
-                parent = elem.getparent()
-                if parent is not None:
-                    parent.remove(elem)
-
-        # Write cleaned XML
-        tree.write(
-            str(doc_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
-
-    def _disable_track_changes(self, settings_xml_path: Path):
-        """Disable track changes in settings.xml.
+        return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    def _remove_track_changes(self, root):
+        """Remove track changes from a parsed document.xml.
 
         Args:
-            settings_xml_path: Path to settings.xml
+            root: Root element of document.xml
         """
-        if not settings_xml_path.exists():
-            return
+        # One traversal collects every revision element in document order
+        for elem in _REVISIONS_XP(root):
+            parent = elem.getparent()
+            if parent is None:
+                continue
 
-        tree = etree.parse(str(settings_xml_path))
-        root = tree.getroot()
+            if elem.tag == _W_INS:
+                # Unwrap insertions: move their children in front of the tag, then drop it
+                for child in list(elem):
+                    elem.addprevious(child)
 
-        # Remove trackRevisions element
-        for track_rev in root.findall('.//w:trackRevisions', namespaces=self.NAMESPACES):
-            parent = track_rev.getparent()
-            parent.remove(track_rev)
+            # Deletions and other revision marks go with their content
+            parent.remove(elem)
 
-        tree.write(
-            str(settings_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
-
-    def _sanitize_metadata(self, core_xml_path: Path, neutral_timestamp: datetime):
-        """Sanitize core metadata properties.
+    def _disable_track_changes_in_settings(self, settings: bytes) -> bytes:
+        """Disable track changes in settings.xml bytes.
 
         Args:
-            core_xml_path: Path to core.xml
-            neutral_timestamp: Timestamp to use
-        """
-        if not core_xml_path.exists():
-            return
+            settings: Raw settings.xml bytes
 
-        tree = etree.parse(str(core_xml_path))
-        root = tree.getroot()
+        Returns:
+            settings.xml without trackRevisions (the input itself if there was none)
+        """
+        if b'trackRevisions' not in settings:
+            return settings
 
-        # Format timestamp
-        timestamp_str = neutral_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if _W_PREFIX_DECL in settings:
+            return _TRACK_REVISIONS_RE.sub(b'', settings)
 
-        # Clear/neutralize various properties
-        properties_to_clear = [
-            ('dc:creator', 'Anonymous'),
-            ('dc:title', ''),
-            ('dc:subject', ''),
-            ('dc:description', ''),
-            ('cp:lastModifiedBy', 'Anonymous'),
-            ('cp:revision', '1'),
-            ('cp:keywords', '')
-        ]
-
-        for prop_name, default_value in properties_to_clear:
-            elem = root.find(f'.//{prop_name}', namespaces=self.NAMESPACES)
-            if elem is not None:
-                elem.text = default_value
+        # Unusual prefix; fall back to editing the tree
+        root = etree.fromstring(settings)
+        self._disable_track_changes(root)
+        return self._serialize(root)
 
-        # Set neutral timestamps
-        timestamp_properties = ['dcterms:created', 'dcterms:modified']
-        for prop_name in timestamp_properties:
-            elem = root.find(f'.//{prop_name}', namespaces=self.NAMESPACES)
-            if elem is not None:
-                elem.text = timestamp_str
-
-        tree.write(
-            str(core_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
-
-    def _sanitize_app_properties(self, app_xml_path: Path):
-        """Sanitize application properties.
+    def _disable_track_changes(self, root):
+        """Disable track changes in a parsed settings.xml.
 
         Args:
-            app_xml_path: Path to app.xml
+            root: Root element of settings.xml
         """
-        if not app_xml_path.exists():
-            return
-
-        tree = etree.parse(str(app_xml_path))
-        root = tree.getroot()
+        # Remove trackRevisions element
+        for track_rev in _TRACK_REVISIONS_XP(root):
+            parent = track_rev.getparent()
+            parent.remove(track_rev)
 
-        # Properties to clear
-        ns = {'ep': 'http://schemas.openxmlformats.org/officeDocument/2006/extended-properties'}
+    def _sanitize_metadata(self, root, neutral_timestamp: datetime):
+        """Sanitize core metadata properties.
 
-        properties_to_clear = [
-            'Company', 'Manager', 'AppVersion', 'Application'
-        ]
+        Args:
+            root: Root element of core.xml
+            neutral_timestamp: Timestamp to use
+        """
+        # Format timestamp
+        timestamp_str = neutral_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        for prop_name in properties_to_clear:
-            elem = root.find(f'.//ep:{prop_name}', namespaces=ns)
-            if elem is not None:
-                elem.text = ''
+        # Clear/neutralize various properties (first match of each)
+        for xpath, default_value in _CORE_PROPERTIES_TO_CLEAR:
+            matches = xpath(root)
+            if matches:
+                matches[0].text = default_value
 
-        tree.write(
-            str(app_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
+        # Set neutral timestamps
+        for elem in _CORE_TIMESTAMPS_XP(root):
+            elem.text = timestamp_str
 
-    def _zip_directory(self, directory: Path, output_path: str):
-        """Zip directory to create DOCX.
+    def _sanitize_app_properties(self, root):
+        """Sanitize application properties.
 
         Args:
-            directory: Directory to zip
-            output_path: Output path
+            root: Root element of app.xml
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(directory)
-                    zipf.write(file_path, arcname)
+        # Clear the first match of each property
+        for xpath in _APP_PROPERTIES_XP:
+            matches = xpath(root)
+            if matches:
+                matches[0].text = ''
@@ -1,7 +1,19 @@
 """Text parsing utilities for sentence segmentation."""
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+# Collapses runs of whitespace before boundary detection
+_WHITESPACE = re.compile(r'\s+')
+
+# Sentence boundaries: . ! ? followed by space/end, accounting for abbreviations
+_SENTENCE_BOUNDARY = re.compile(
+    r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s+(?=[A-Z])|(?<=\.|\?|\!)$'
+)
+
+# Folds ! and ? into . so the simple splitter can use a plain str.split
+_PUNCTUATION_FOLD = str.maketrans({'!': '.', '?': '.'})
 
 
 class SentenceParser:
@@ -9,11 +21,8 @@ class SentenceParser:
 
     def __init__(self):
         """Initialize sentence parser."""
-        # Regex pattern for sentence boundaries
-        # Matches: . ! ? followed by space/end, accounting for abbreviations
-        self.sentence_pattern = re.compile(
-            r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s+(?=[A-Z])|(?<=\.|\?|\!)$'
-        )
+        # Regex pattern for sentence boundaries (compiled once at import)
+        self.sentence_pattern = _SENTENCE_BOUNDARY
 
     def parse(self, text: str) -> List[str]:
         """Parse text into sentences.
@@ -25,7 +34,7 @@ class SentenceParser:
             List of sentences
         """
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE.sub(' ', text.strip())
 
         if not text:
             return []
@@ -53,18 +62,38 @@ class SentenceParser:
         Returns:
             List of sentences
         """
-        # Split on . ! ?
-        sentences = re.split(r'[.!?]+', text)
+        # Split on . ! ? (runs of punctuation leave empty pieces, dropped below)
+        pieces = text.translate(_PUNCTUATION_FOLD).split('.')
 
         # Clean and filter
-        sentences = [s.strip() for s in sentences if s.strip()]
+        return [s for s in map(str.strip, pieces) if s]
 
-        return sentences
+
+# Shared parser so convenience calls don't rebuild state per invocation
+_DEFAULT_PARSER = SentenceParser()
+
+
+@lru_cache(maxsize=256)
+def _cached_split(text: str, method: str) -> Tuple[str, ...]:
+    """Split text with the shared parser, memoized on the input.
+
+    Args:
+        text: Input text
+        method: Parsing method ('regex' or 'simple')
+
+    Returns:
+        Tuple of sentences (immutable so cached entries can't be mutated)
+    """
+    if method == "simple":
+        return tuple(_DEFAULT_PARSER.parse_simple(text))
+    return tuple(_DEFAULT_PARSER.parse(text))
 
 
 def split_into_sentences(text: str, method: str = "regex") -> List[str]:
     """Convenience function to split text into sentences.
 
+    Results are cached, so repeated calls with the same text skip reparsing.
+
     Args:
         text: Input text
         method: Parsing method ('regex' or 'simple')
@@ -72,9 +101,7 @@ def split_into_sentences(text: str, method: str = "regex") -> List[str]:
     Returns:
         List of sentences
     """
-    parser = SentenceParser()
+    if method != "simple":
+        method = "regex"
 
-    if method == "simple":
-        return parser.parse_simple(text)
-    else:
-        return parser.parse(text)
+    return list(_cached_split(text, method))
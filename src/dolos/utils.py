@@ -1,6 +1,8 @@
 """Utility functions for Dolos."""
 
 import random
+from functools import lru_cache
+from itertools import accumulate
 from datetime import datetime, timedelta
 from typing import List, Tuple
 from pathlib import Path
@@ -20,8 +22,19 @@ def generate_random_intervals(
 
     Returns:
         List of random intervals in seconds
+
+    Raises:
+        ValueError: If min_seconds is greater than max_seconds
     """
-    return [random.randint(min_seconds, max_seconds) for _ in range(count)]
+    # Checked up front: choices would fail on the empty range with IndexError,
+    # where randint raised ValueError (nothing is drawn when count is 0)
+    if count > 0 and min_seconds > max_seconds:
+        raise ValueError(
+            f"min_seconds ({min_seconds}) must not be greater than max_seconds ({max_seconds})"
+        )
+
+    # choices draws all values in one call, uniformly like randint
+    return random.choices(range(min_seconds, max_seconds + 1), k=count)
 
 
 def generate_timestamps(
@@ -41,20 +54,43 @@ def generate_timestamps(
     Returns:
         List of datetime objects
     """
-    timestamps = [start_time]
-    current_time = start_time
+    # Running offsets from the start: 0, i1, i1 + i2, ...
+    offsets = accumulate(
+        generate_random_intervals(max(count - 1, 0), min_interval, max_interval),
+        initial=0
+    )
+    return [start_time + timedelta(seconds=offset) for offset in offsets]
+
+
+# Accepted timestamp formats, tried in order
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d",
+)
 
-    for _ in range(count - 1):
-        interval = random.randint(min_interval, max_interval)
-        current_time = current_time + timedelta(seconds=interval)
-        timestamps.append(current_time)
 
-    return timestamps
+def _timestamp_shape(text: str) -> Tuple[bool, int]:
+    """Classify a timestamp or format by its date separator and number of colons."""
+    return '/' in text, text.count(':')
 
 
+# Formats grouped by shape; a value can only match formats of its own shape,
+# since strptime requires the '/' and ':' literals to appear exactly
+_FORMATS_BY_SHAPE = {}
+for _fmt in _TIMESTAMP_FORMATS:
+    _FORMATS_BY_SHAPE.setdefault(_timestamp_shape(_fmt), []).append(_fmt)
+
+
+@lru_cache(maxsize=512)
 def parse_timestamp(timestamp_str: str) -> datetime:
     """Parse timestamp string in various formats.
 
+    Results are cached, so repeated values (e.g. a shared neutral date) are parsed once.
+
     Args:
         timestamp_str: Timestamp string
 
@@ -64,16 +100,8 @@ def parse_timestamp(timestamp_str: str) -> datetime:
     Raises:
         ValueError: If timestamp format is not recognized
     """
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d",
-        "%Y/%m/%d %H:%M:%S",
-        "%Y/%m/%d",
-    ]
-
-    for fmt in formats:
+    # Only formats that can match are tried, so most values parse on the first attempt
+    for fmt in _FORMATS_BY_SHAPE.get(_timestamp_shape(timestamp_str), ()):
         try:
             return datetime.strptime(timestamp_str, fmt)
         except ValueError:
@@ -96,7 +124,10 @@ def ensure_directory(path: str) -> Path:
     return dir_path
 
 
-def format_timestamp(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
+_DEFAULT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def format_timestamp(dt: datetime, format_str: str = _DEFAULT_FORMAT) -> str:
     """Format datetime to string.
 
     Args:
@@ -106,4 +137,10 @@ def format_timestamp(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str
     Returns:
         Formatted timestamp string
     """
+    if format_str == _DEFAULT_FORMAT:
+        # Fixed-width fields for the default layout skip strftime's format parsing
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
     return dt.strftime(format_str)
@@ -1,16 +1,188 @@
 """XML manipulation for injecting track changes into DOCX files."""
 
+import io
+import re
 import zipfile
-import shutil
+from contextlib import contextmanager
+from os import PathLike
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
-import tempfile
+from typing import BinaryIO, Dict, List, Mapping, Optional, Union
 import random
 
 from lxml import etree
 
 from .models import Sentence
+from ._xml_fast import W_NS, _TRACK_REVISIONS_RE, _W_PREFIX_DECL, _w3c_date, _xml_escape, _xml_escape_attr
+from ._zip_fast import _compress_type, _copy_entry
+
+# Wrapper so generated paragraphs can be parsed in one pass and moved into the body
+_FRAGMENT_OPEN = b'<w:body xmlns:w="' + W_NS.encode() + b'">'
+_FRAGMENT_CLOSE = b'</w:body>'
+
+# Paragraph templates (rsid, [revision id, author, date,] text, space run)
+_TRACKED_P = (
+    b'<w:p w:rsidR="%s" w:rsidRDefault="%s">'
+    b'<w:ins w:id="%s" w:author="%s" w:date="%s">'
+    b'<w:r w:rsidR="%s"><w:t xml:space="preserve">%s</w:t></w:r>%s'
+    b'</w:ins></w:p>'
+)
+_CLEAN_P = (
+    b'<w:p w:rsidR="%s" w:rsidRDefault="%s">'
+    b'<w:r w:rsidR="%s"><w:t xml:space="preserve">%s</w:t></w:r>%s'
+    b'</w:p>'
+)
+_SPACE_RUN = b'<w:r w:rsidR="%s"><w:t xml:space="preserve"> </w:t></w:r>'
+
+# Opening <w:ins> tags and their date attribute, for in-place timestamp patches
+_INS_OPEN_RE = re.compile(rb'<w:ins\b[^>]*>')
+_DATE_ATTR_RE = re.compile(rb'(w:date=")[^"]*(")')
+
+# Body open tag, and any paragraph start tag (not w:pPr, w:proofErr etc.)
+_BODY_OPEN_RE = re.compile(rb'<w:body\b[^>]*?(/?)>')
+_PARAGRAPH_TAG_RE = re.compile(rb'<w:p[\s>/]')
+
+# One parser for every part: no entity expansion, no xml:id table, and no
+# libxml2 size limits tripping on very large generated bodies
+_PARSER = etree.XMLParser(huge_tree=True, resolve_entities=False, collect_ids=False)
+
+# Compiled once; each returns the list of matches for a parsed root
+_W_NSMAP = {'w': W_NS}
+_BODY_XP = etree.XPath('.//w:body', namespaces=_W_NSMAP)
+_SECT_PR_XP = etree.XPath('w:sectPr', namespaces=_W_NSMAP)
+_TRACK_REVISIONS_XP = etree.XPath('.//w:trackRevisions', namespaces=_W_NSMAP)
+_RSID_ROOT_XP = etree.XPath('.//w:rsidRoot', namespaces=_W_NSMAP)
+
+# Clark-notation tag names, built once instead of per element
+_W_P = f'{{{W_NS}}}p'
+_W_SETTINGS = f'{{{W_NS}}}settings'
+_W_TRACK_REVISIONS = f'{{{W_NS}}}trackRevisions'
+_W_RSID_ROOT = f'{{{W_NS}}}rsidRoot'
+_W_VAL = f'{{{W_NS}}}val'
+
+# One generator for all RSIDs; getrandbits(32) covers the same range as randint(0, 0xFFFFFFFF)
+_rsid_bits = random.Random().getrandbits
+
+
+def _new_rsids(count: int) -> List[bytes]:
+    """Generate random RSIDs as ASCII bytes for direct use in paragraph templates.
+
+    All RSIDs come from a single getrandbits call whose hex digits are sliced
+    into 8-character pieces, rather than one call and format per paragraph.
+
+    Args:
+        count: Number of RSIDs to generate
+
+    Returns:
+        List of 8-character uppercase hex RSIDs
+    """
+    digits = b'%0*X' % (8 * count, _rsid_bits(32 * count))
+    return [digits[i:i + 8] for i in range(0, 8 * count, 8)]
+
+
+def _splice_into_body(document_xml: bytes, paragraphs: bytes) -> Optional[bytes]:
+    """Insert paragraphs into a document.xml body that has none, without parsing it.
+
+    The paragraphs go before the body's sectPr (or its closing tag), which is
+    where the tree-based edit puts them.
+
+    Args:
+        document_xml: Raw document.xml bytes
+        paragraphs: Concatenated <w:p> elements
+
+    Returns:
+        Patched document.xml bytes, or None if the body already has paragraphs,
+        is self-closing, or the w prefix is not bound to WordprocessingML
+    """
+    if _W_PREFIX_DECL not in document_xml:
+        return None
+
+    body = _BODY_OPEN_RE.search(document_xml)
+    if body is None or body.group(1):
+        return None
+
+    insert_at = document_xml.find(b'<w:sectPr', body.end())
+    if insert_at == -1:
+        insert_at = document_xml.find(b'</w:body>', body.end())
+        if insert_at == -1:
+            return None
+
+    # Existing paragraphs would have to be removed, which needs the tree
+    if _PARAGRAPH_TAG_RE.search(document_xml, body.end(), insert_at):
+        return None
+
+    return document_xml[:insert_at] + paragraphs + document_xml[insert_at:]
+
+
+def _replace_body_paragraphs(root, paragraphs: bytes) -> None:
+    """Replace the top-level paragraphs of a parsed document.xml body.
+
+    Args:
+        root: Root element of document.xml
+        paragraphs: Concatenated <w:p> elements to add
+
+    Raises:
+        ValueError: If the document has no body
+    """
+    # Find the body element
+    bodies = _BODY_XP(root)
+
+    if not bodies:
+        raise ValueError("Could not find document body")
+    body = bodies[0]
+
+    # Save sectPr (section properties) if it exists - it must be at the end
+    sect_prs = _SECT_PR_XP(body)
+    sect_pr = sect_prs[0] if sect_prs else None
+    if sect_pr is not None:
+        body.remove(sect_pr)
+
+    # Remove existing top-level paragraphs in one slice assignment, keeping
+    # other children (strip_elements would also reach paragraphs inside tables)
+    body[:] = [child for child in body if child.tag != _W_P]
+
+    # Parse all new paragraphs as one fragment and move them into the body
+    body.extend(etree.fromstring(_FRAGMENT_OPEN + paragraphs + _FRAGMENT_CLOSE, _PARSER))
+
+    # Re-add sectPr at the end if it existed
+    if sect_pr is not None:
+        body.append(sect_pr)
+
+
+def _read_source(docx_path: Union[str, BinaryIO]) -> io.BytesIO:
+    """Read a source package into memory so it can be overwritten in place.
+
+    Args:
+        docx_path: Path to source DOCX file, or a seekable binary file object
+
+    Returns:
+        In-memory copy of the package
+    """
+    if isinstance(docx_path, (str, PathLike)):
+        return io.BytesIO(Path(docx_path).read_bytes())
+    docx_path.seek(0)
+    return io.BytesIO(docx_path.read())
+
+
+@contextmanager
+def _open_output(output: Union[str, BinaryIO]):
+    """Open a path for binary writing, or rewind and truncate a file object.
+
+    Args:
+        output: Output path or binary file object
+
+    Yields:
+        Binary file object positioned at the start
+    """
+    if isinstance(output, (str, PathLike)):
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'wb') as f:
+            yield f
+    else:
+        output.seek(0)
+        output.truncate()
+        yield output
 
 
 class TrackChangesInjector:
@@ -30,51 +202,193 @@ class TrackChangesInjector:
 
     def inject_track_changes(
         self,
-        docx_path: str,
+        docx_path: Union[str, BinaryIO],
         sentences: List[Sentence],
-        output_path: Optional[str] = None,
+        output_path: Optional[Union[str, BinaryIO]] = None,
         accept_changes: bool = False
-    ) -> str:
+    ) -> Union[str, BinaryIO]:
         """Inject track changes for each sentence into a DOCX file.
 
         Args:
-            docx_path: Path to source DOCX file
+            docx_path: Path to source DOCX file, or a seekable binary file object
             sentences: List of Sentence objects with timestamps
-            output_path: Output path (if None, overwrites input)
+            output_path: Output path or binary file object (if None, overwrites input)
             accept_changes: If True, accept all changes (text becomes final, not suggestions)
 
         Returns:
-            Path to modified document
+            Path to modified document, or the file object it was written to
         """
         if output_path is None:
             output_path = docx_path
 
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        with zipfile.ZipFile(_read_source(docx_path), 'r') as zin:
+            # Only the parts the injection rewrites are decompressed
+            parts = {
+                name: zin.read(name)
+                for name in ('word/document.xml', 'word/settings.xml')
+                if name in zin.NameToInfo
+            }
+            self.inject_into_parts(parts, sentences, accept_changes=accept_changes)
+
+            with _open_output(output_path) as output:
+                with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                    # Add [Content_Types].xml first WITHOUT compression for Word compatibility
+                    content_types = zin.NameToInfo.get('[Content_Types].xml')
+                    if content_types is not None:
+                        zipf.writestr(
+                            '[Content_Types].xml',
+                            zin.read(content_types),
+                            compress_type=zipfile.ZIP_STORED
+                        )
+
+                    for info in zin.infolist():
+                        name = info.filename
+                        if name == '[Content_Types].xml':
+                            continue
+                        data = parts.pop(name, None)
+                        if data is not None:
+                            zipf.writestr(name, data, compress_type=_compress_type(name))
+                        elif info.compress_type != _compress_type(name):
+                            # Parts whose compression doesn't match _compress_type are
+                            # rewritten with the preferred method
+                            zipf.writestr(name, zin.read(info), compress_type=_compress_type(name))
+                        else:
+                            # Every other part is copied still compressed
+                            _copy_entry(zin, zipf, info)
+
+                    # Parts the injection added (a missing settings.xml)
+                    for name, data in parts.items():
+                        zipf.writestr(name, data, compress_type=_compress_type(name))
 
-            # Extract DOCX (it's a ZIP file)
-            with zipfile.ZipFile(docx_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
+        return output_path
 
-            # Modify document.xml
-            doc_xml_path = temp_path / 'word' / 'document.xml'
+    def inject_into_parts(
+        self,
+        parts: Dict[str, bytes],
+        sentences: List[Sentence],
+        accept_changes: bool = False
+    ) -> Dict[str, bytes]:
+        """Inject track changes into in-memory DOCX parts.
+
+        Same transformation as inject_track_changes, but operates on a mapping of
+        archive names to part bytes so no ZIP or temp directory round-trip is needed.
+
+        Args:
+            parts: Mapping of archive member names to their bytes (modified in place)
+            sentences: List of Sentence objects with timestamps
+            accept_changes: If True, accept all changes (text becomes final, not suggestions)
 
-            if accept_changes:
-                # Add sentences as final text (no track changes)
-                self._add_clean_text(doc_xml_path, sentences)
+        Returns:
+            The updated parts mapping
+        """
+        document_xml = parts['word/document.xml']
+        if accept_changes:
+            paragraphs = self._clean_paragraphs(sentences)
+        else:
+            paragraphs = self._tracked_paragraphs(sentences)
+
+        # A body without paragraphs (such as a fresh template) takes the new ones
+        # as a byte splice; anything else is rebuilt through the tree
+        spliced = _splice_into_body(document_xml, paragraphs)
+        if spliced is not None:
+            parts['word/document.xml'] = spliced
+        else:
+            root = etree.fromstring(document_xml, _PARSER)
+            _replace_body_paragraphs(root, paragraphs)
+            parts['word/document.xml'] = self._serialize(root)
+
+        if not accept_changes:
+            settings = parts.get('word/settings.xml')
+            if settings is None:
+                parts['word/settings.xml'] = self._serialize(self._build_settings_root())
             else:
-                # Add sentences with track changes
-                self._inject_changes_into_xml(doc_xml_path, sentences)
-                # Enable track changes in settings.xml
-                settings_xml_path = temp_path / 'word' / 'settings.xml'
-                self._enable_track_changes(settings_xml_path)
+                parts['word/settings.xml'] = self._enable_track_changes_in_settings(settings)
+
+        return parts
+
+    def patch_timestamps(
+        self,
+        docx_path: Union[str, BinaryIO],
+        timestamps: Mapping[int, datetime],
+        output_path: Optional[Union[str, BinaryIO]] = None
+    ) -> Union[str, BinaryIO]:
+        """Rewrite the dates of specific tracked insertions without rebuilding the document.
+
+        Only word/document.xml is touched; every other part is copied as-is.
+
+        Args:
+            docx_path: Path to source DOCX file, or a seekable binary file object
+            timestamps: Mapping of sentence position (0-indexed) to its new timestamp
+            output_path: Output path or binary file object (if None, overwrites input)
+
+        Returns:
+            Path to modified document, or the file object it was written to
+
+        Raises:
+            ValueError: If a position has no tracked insertion in the document
+        """
+        if output_path is None:
+            output_path = docx_path
 
-            # Repackage as DOCX
-            self._zip_directory(temp_path, output_path)
+        with zipfile.ZipFile(_read_source(docx_path), 'r') as zin:
+            # Patch before opening the output so a bad position leaves it untouched
+            document_xml = self._patch_ins_dates(zin.read('word/document.xml'), timestamps)
+
+            with _open_output(output_path) as output:
+                with zipfile.ZipFile(output, 'w') as zipf:
+                    for info in zin.infolist():
+                        if info.filename == 'word/document.xml':
+                            zipf.writestr(info, document_xml, compresslevel=1)
+                        else:
+                            # Every other part is copied still compressed
+                            _copy_entry(zin, zipf, info)
 
         return output_path
 
+    def _patch_ins_dates(self, document_xml: bytes, timestamps: Mapping[int, datetime]) -> bytes:
+        """Replace the w:date attribute of the Nth <w:ins> for each given position.
+
+        Args:
+            document_xml: Raw document.xml bytes
+            timestamps: Mapping of sentence position to new timestamp
+
+        Returns:
+            Patched document.xml bytes
+        """
+        ins_tags = list(_INS_OPEN_RE.finditer(document_xml))
+        missing = [pos for pos in timestamps if not 0 <= pos < len(ins_tags)]
+        if missing:
+            raise ValueError(f"No tracked insertion for sentence(s): {sorted(missing)}")
+
+        chunks = []
+        last_end = 0
+        for pos in sorted(timestamps):
+            match = ins_tags[pos]
+            date_str = _w3c_date(timestamps[pos])
+            tag = _DATE_ATTR_RE.sub(lambda m: m.group(1) + date_str + m.group(2), match.group(0))
+            chunks.append(document_xml[last_end:match.start()])
+            chunks.append(tag)
+            last_end = match.end()
+        chunks.append(document_xml[last_end:])
+
+        return b''.join(chunks)
+
+    def _serialize(self, root) -> bytes:
+        """Serialize an XML root to bytes with the standard DOCX declaration.
+
+        Args:
+            root: Root element
+
+        Returns:
+            Serialized XML bytes
+        """
+        return etree.tostring(
+            root,
+            xml_declaration=True,
+            encoding='UTF-8',
+            standalone=True
+        )
+
     def _generate_rsid(self) -> str:
         """Generate a random RSID (Revision Save ID).
 
@@ -83,247 +397,123 @@ class TrackChangesInjector:
         Returns:
             8-character hex string
         """
-        return '{:08X}'.format(random.randint(0, 0xFFFFFFFF))
+        return '%08X' % _rsid_bits(32)
 
-    def _inject_changes_into_xml(self, xml_path: Path, sentences: List[Sentence]):
-        """Inject track changes into document.xml.
+    def _tracked_paragraphs(self, sentences: List[Sentence]) -> bytes:
+        """Emit one tracked-insertion paragraph per sentence as raw XML.
 
         Args:
-            xml_path: Path to document.xml
             sentences: List of Sentence objects
-        """
-        # Parse XML
-        tree = etree.parse(str(xml_path))
-        root = tree.getroot()
-
-        # Find the body element
-        body = root.find('.//w:body', namespaces=self.NAMESPACES)
 
-        if body is None:
-            raise ValueError("Could not find document body")
+        Returns:
+            Concatenated <w:p> elements as UTF-8 bytes
+        """
+        fragment = []
+        last_idx = len(sentences) - 1
+        # One unique RSID per edit, generated up front
+        rsids = _new_rsids(len(sentences))
+        for idx, sentence in enumerate(sentences):
+            rsid = rsids[idx]
 
-        # Save sectPr (section properties) if it exists - it must be at the end
-        sect_pr = body.find('w:sectPr', namespaces=self.NAMESPACES)
-        if sect_pr is not None:
-            body.remove(sect_pr)
+            fragment.append(_TRACKED_P % (
+                rsid,
+                rsid,
+                str(sentence.revision_id).encode('ascii'),
+                _xml_escape_attr(sentence.author),
+                _w3c_date(sentence.modified_timestamp),
+                rsid,
+                _xml_escape(sentence.sentence_text),
+                # Add space after sentence if not the last one
+                _SPACE_RUN % rsid if idx < last_idx else b''
+            ))
 
-        # Remove existing paragraphs
-        for para in body.findall('w:p', namespaces=self.NAMESPACES):
-            body.remove(para)
+        return b''.join(fragment)
 
-        # Add sentences with track changes
-        for idx, sentence in enumerate(sentences):
-            # Generate unique RSID for this edit
-            rsid = self._generate_rsid()
-
-            # Create paragraph
-            para = etree.SubElement(body, f"{{{self.NAMESPACES['w']}}}p")
-            # Add rsid attributes to paragraph
-            para.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-            para.set(f"{{{self.NAMESPACES['w']}}}rsidRDefault", rsid)
-
-            # Create insertion (track change)
-            ins = etree.SubElement(para, f"{{{self.NAMESPACES['w']}}}ins")
-
-            # Set track change attributes
-            ins.set(f"{{{self.NAMESPACES['w']}}}id", str(sentence.revision_id))
-            ins.set(f"{{{self.NAMESPACES['w']}}}author", sentence.author)
-
-            # Format timestamp for Word (ISO 8601 format)
-            timestamp_str = sentence.modified_timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
-            ins.set(f"{{{self.NAMESPACES['w']}}}date", timestamp_str)
-
-            # Create run (text container)
-            run = etree.SubElement(ins, f"{{{self.NAMESPACES['w']}}}r")
-            # Add rsidR to run as well
-            run.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-
-            # Add text
-            text_elem = etree.SubElement(run, f"{{{self.NAMESPACES['w']}}}t")
-            # Add xml:space="preserve" to preserve whitespace
-            text_elem.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
-            text_elem.text = sentence.sentence_text
-
-            # Add space after sentence if not the last one
-            if idx < len(sentences) - 1:
-                space_run = etree.SubElement(ins, f"{{{self.NAMESPACES['w']}}}r")
-                space_run.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-                space_text = etree.SubElement(space_run, f"{{{self.NAMESPACES['w']}}}t")
-                space_text.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
-                space_text.text = " "
-
-        # Re-add sectPr at the end if it existed
-        if sect_pr is not None:
-            body.append(sect_pr)
-
-        # Write modified XML
-        tree.write(
-            str(xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
+    def _enable_track_changes_in_settings(self, settings: bytes) -> bytes:
+        """Turn on revision tracking in settings.xml bytes.
 
-    def _enable_track_changes(self, settings_xml_path: Path):
-        """Enable track changes in settings.xml.
+        The missing elements are spliced in before the closing tag, which is
+        where the tree-based edit appends them, so the part is not reparsed.
 
         Args:
-            settings_xml_path: Path to settings.xml
+            settings: Raw settings.xml bytes
+
+        Returns:
+            Patched settings.xml bytes
         """
-        if not settings_xml_path.exists():
-            # Create minimal settings.xml if it doesn't exist
-            self._create_settings_xml(settings_xml_path)
-            return
+        close = settings.rfind(b'</w:settings>')
+        if close == -1 or _W_PREFIX_DECL not in settings:
+            # Unusual prefix or an empty root; fall back to editing the tree
+            root = etree.fromstring(settings, _PARSER)
+            self._enable_track_changes_in_root(root)
+            return self._serialize(root)
 
-        # Parse existing settings
-        tree = etree.parse(str(settings_xml_path))
-        root = tree.getroot()
+        additions = b''
+        if not _TRACK_REVISIONS_RE.search(settings):
+            additions += b'<w:trackRevisions/>'
+        if b'<w:rsidRoot' not in settings:
+            additions += b'<w:rsidRoot w:val="%s"/>' % self.rsid_root.encode('ascii')
 
-        # Check if trackRevisions already exists
-        track_revisions = root.find('.//w:trackRevisions', namespaces=self.NAMESPACES)
+        return settings[:close] + additions + settings[close:]
 
-        if track_revisions is None:
-            # Add trackRevisions element
-            track_revisions = etree.SubElement(root, f"{{{self.NAMESPACES['w']}}}trackRevisions")
+    def _enable_track_changes_in_root(self, root):
+        """Turn on revision tracking in a parsed settings.xml.
+
+        Args:
+            root: Root element of settings.xml
+        """
+        # Add trackRevisions element unless it already exists
+        if not _TRACK_REVISIONS_XP(root):
+            etree.SubElement(root, _W_TRACK_REVISIONS)
 
         # Add rsidRoot for better compatibility
-        rsid_root_elem = root.find('.//w:rsidRoot', namespaces=self.NAMESPACES)
-        if rsid_root_elem is None:
-            rsid_root_elem = etree.SubElement(root, f"{{{self.NAMESPACES['w']}}}rsidRoot")
-            rsid_root_elem.set(f"{{{self.NAMESPACES['w']}}}val", self.rsid_root)
-
-        # Write modified settings
-        tree.write(
-            str(settings_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
+        if not _RSID_ROOT_XP(root):
+            rsid_root_elem = etree.SubElement(root, _W_RSID_ROOT)
+            rsid_root_elem.set(_W_VAL, self.rsid_root)
 
-    def _create_settings_xml(self, settings_xml_path: Path):
-        """Create a minimal settings.xml with track changes enabled.
+    def _build_settings_root(self):
+        """Build a minimal settings.xml root with track changes enabled.
 
-        Args:
-            settings_xml_path: Path to create settings.xml
+        Returns:
+            Root element of the new settings.xml
         """
         root = etree.Element(
-            f"{{{self.NAMESPACES['w']}}}settings",
-            nsmap={'w': self.NAMESPACES['w']}
+            _W_SETTINGS,
+            nsmap={'w': W_NS}
         )
 
         # Add trackRevisions
-        etree.SubElement(root, f"{{{self.NAMESPACES['w']}}}trackRevisions")
+        etree.SubElement(root, _W_TRACK_REVISIONS)
 
         # Add rsidRoot
-        rsid_root_elem = etree.SubElement(root, f"{{{self.NAMESPACES['w']}}}rsidRoot")
-        rsid_root_elem.set(f"{{{self.NAMESPACES['w']}}}val", self.rsid_root)
-
-        # Write XML
-        tree = etree.ElementTree(root)
-        settings_xml_path.parent.mkdir(parents=True, exist_ok=True)
-        tree.write(
-            str(settings_xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
+        rsid_root_elem = etree.SubElement(root, _W_RSID_ROOT)
+        rsid_root_elem.set(_W_VAL, self.rsid_root)
+
+        return root
 
-    def _add_clean_text(self, xml_path: Path, sentences: List[Sentence]):
-        """Add sentences as clean final text (no track changes).
+    def _clean_paragraphs(self, sentences: List[Sentence]) -> bytes:
+        """Emit one plain paragraph per sentence (no insertion tags) as raw XML.
 
         Args:
-            xml_path: Path to document.xml
             sentences: List of Sentence objects
-        """
-        # Parse XML
-        tree = etree.parse(str(xml_path))
-        root = tree.getroot()
-
-        # Find the body element
-        body = root.find('.//w:body', namespaces=self.NAMESPACES)
-
-        if body is None:
-            raise ValueError("Could not find document body")
 
-        # Save sectPr (section properties) if it exists - it must be at the end
-        sect_pr = body.find('w:sectPr', namespaces=self.NAMESPACES)
-        if sect_pr is not None:
-            body.remove(sect_pr)
-
-        # Remove existing paragraphs
-        for para in body.findall('w:p', namespaces=self.NAMESPACES):
-            body.remove(para)
-
-        # Add sentences as clean text (no track changes)
-        for idx, sentence in enumerate(sentences):
-            # Generate unique RSID for this paragraph
-            rsid = self._generate_rsid()
-
-            # Create paragraph
-            para = etree.SubElement(body, f"{{{self.NAMESPACES['w']}}}p")
-            # Add rsid attributes even for clean text
-            para.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-            para.set(f"{{{self.NAMESPACES['w']}}}rsidRDefault", rsid)
-
-            # Create run (text container) - NO insertion tag
-            run = etree.SubElement(para, f"{{{self.NAMESPACES['w']}}}r")
-            run.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-
-            # Add text
-            text_elem = etree.SubElement(run, f"{{{self.NAMESPACES['w']}}}t")
-            # Add xml:space="preserve" to preserve whitespace
-            text_elem.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
-            text_elem.text = sentence.sentence_text
-
-            # Add space after sentence if not the last one
-            if idx < len(sentences) - 1:
-                space_run = etree.SubElement(para, f"{{{self.NAMESPACES['w']}}}r")
-                space_run.set(f"{{{self.NAMESPACES['w']}}}rsidR", rsid)
-                space_text = etree.SubElement(space_run, f"{{{self.NAMESPACES['w']}}}t")
-                space_text.set('{http://www.w3.org/XML/1998/namespace}space', 'preserve')
-                space_text.text = " "
-
-        # Re-add sectPr at the end if it existed
-        if sect_pr is not None:
-            body.append(sect_pr)
-
-        # Write modified XML
-        tree.write(
-            str(xml_path),
-            xml_declaration=True,
-            encoding='UTF-8',
-            standalone=True,
-            pretty_print=False
-        )
-
-    def _zip_directory(self, directory: Path, output_path: str):
-        """Zip directory contents to create DOCX file.
-
-        Args:
-            directory: Directory to zip
-            output_path: Output DOCX path
+        Returns:
+            Concatenated <w:p> elements as UTF-8 bytes
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add [Content_Types].xml first WITHOUT compression for Word compatibility
-            content_types = directory / '[Content_Types].xml'
-            if content_types.exists():
-                zipf.write(content_types, '[Content_Types].xml', compress_type=zipfile.ZIP_STORED)
-
-            # Add _rels/.rels second
-            rels_file = directory / '_rels' / '.rels'
-            if rels_file.exists():
-                zipf.write(rels_file, '_rels/.rels')
-
-            # Add all other files
-            for file_path in sorted(directory.rglob('*')):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(directory)
-                    # Skip files we already added
-                    if str(arcname) not in ('[Content_Types].xml', '_rels/.rels'):
-                        zipf.write(file_path, arcname)
+        fragment = []
+        last_idx = len(sentences) - 1
+        # One unique RSID per paragraph, generated up front
+        rsids = _new_rsids(len(sentences))
+        for idx, sentence in enumerate(sentences):
+            rsid = rsids[idx]
+
+            fragment.append(_CLEAN_P % (
+                rsid,
+                rsid,
+                rsid,
+                _xml_escape(sentence.sentence_text),
+                # Add space after sentence if not the last one
+                _SPACE_RUN % rsid if idx < last_idx else b''
+            ))
+
+        return b''.join(fragment)
@@ -0,0 +1,25 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+from datetime import datetime, timedelta
+from dolos.models import Sentence
+
+
+@pytest.fixture
+def make_sentences():
+    """Provide a factory for detached Sentence objects with increasing timestamps."""
+    def factory(texts, author="Dolos"):
+        start = datetime(2025, 1, 1, 10, 0, 0)
+        sentences = []
+        for idx, text in enumerate(texts):
+            timestamp = start + timedelta(minutes=idx)
+            sentences.append(Sentence(
+                sentence_text=text,
+                position=idx,
+                created_timestamp=timestamp,
+                modified_timestamp=timestamp,
+                author=author,
+                revision_id=idx + 1
+            ))
+        return sentences
+    return factory
@@ -0,0 +1,221 @@
+"""Tests for document builder."""
+
+import pytest
+import tempfile
+import zipfile
+from pathlib import Path
+from dolos.document_builder import DocumentBuilder
+
+
+class TestDocumentBuilder:
+    """Test document building functionality."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create temporary output directory."""
+        with tempfile.TemporaryDirectory() as d:
+            yield Path(d)
+
+    def test_create_document_with_track_changes(self, temp_dir, make_sentences):
+        """Test building a document with tracked insertions in one pass."""
+        sentences = make_sentences(["First sentence.", "Second sentence."])
+        output = temp_dir / "tracked.docx"
+
+        DocumentBuilder().create_document_with_track_changes(
+            sentences=sentences,
+            output_path=str(output),
+            author="TestAuthor"
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist()[0] == "[Content_Types].xml"
+            document_xml = zf.read("word/document.xml")
+            settings_xml = zf.read("word/settings.xml")
+
+        assert document_xml.count(b"<w:ins ") == 2
+        assert b"First sentence." in document_xml
+        assert b'w:date="2025-01-01T10:01:00Z"' in document_xml
+        assert b"trackRevisions" in settings_xml
+
+    def test_create_document_with_accepted_changes(self, temp_dir, make_sentences):
+        """Test building a document whose text is final."""
+        sentences = make_sentences(["Only sentence."])
+        output = temp_dir / "final.docx"
+
+        DocumentBuilder().create_document_with_track_changes(
+            sentences=sentences,
+            output_path=str(output),
+            accept_changes=True
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            document_xml = zf.read("word/document.xml")
+
+        assert b"<w:ins " not in document_xml
+        assert b"Only sentence." in document_xml
+
+    def test_create_document_escapes_text(self, temp_dir, make_sentences):
+        """Test that directly emitted body XML escapes special characters."""
+        from docx import Document as DocxDocument
+
+        sentences = make_sentences(["Fish & chips.", "A < B > C."])
+        output = temp_dir / "plain.docx"
+
+        DocumentBuilder().create_document(sentences=sentences, output_path=str(output))
+
+        paragraphs = [p.text for p in DocxDocument(str(output)).paragraphs]
+        assert paragraphs == ["Fish & chips. ", "A < B > C."]
+
+    def test_track_changes_escape_author(self, temp_dir, make_sentences):
+        """Test that authors with markup characters survive injection."""
+        from lxml import etree
+
+        sentences = make_sentences(["Quoted <author>."], author='O"Neil & Co')
+        output = temp_dir / "author.docx"
+
+        DocumentBuilder().create_document_with_track_changes(
+            sentences=sentences,
+            output_path=str(output)
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            root = etree.fromstring(zf.read("word/document.xml"))
+
+        w = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+        ins = root.find(f".//{w}ins")
+        assert ins.get(f"{w}author") == 'O"Neil & Co'
+        assert ins.find(f".//{w}t").text == "Quoted <author>."
+
+    def test_static_parts_reused(self, temp_dir, make_sentences):
+        """Test that precompressed template parts round-trip unchanged."""
+        from dolos.document_builder import _static_package
+
+        output = temp_dir / "static.docx"
+        DocumentBuilder().create_document(
+            sentences=make_sentences(["Static parts."]),
+            output_path=str(output)
+        )
+
+        _, static_parts = _static_package()
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist()[0] == "[Content_Types].xml"
+            for name, data in static_parts.items():
+                assert zf.read(name) == data
+            assert b"Static parts." in zf.read("word/document.xml")
+
+    def test_create_documents_in_parallel(self, temp_dir, make_sentences):
+        """Test building a batch of documents across worker processes."""
+        jobs = [
+            {
+                "sentences": make_sentences([f"Document {idx}."]),
+                "output_path": str(temp_dir / f"batch_{idx}.docx")
+            }
+            for idx in range(3)
+        ]
+
+        paths = DocumentBuilder().create_documents(jobs, max_workers=2)
+
+        assert paths == [job["output_path"] for job in jobs]
+        for idx, path in enumerate(paths):
+            with zipfile.ZipFile(path) as zf:
+                assert f"Document {idx}.".encode() in zf.read("word/document.xml")
+
+    def test_core_properties_match_python_docx(self, temp_dir, make_sentences):
+        """Test that directly emitted core properties match python-docx output."""
+        import io
+        from docx import Document as DocxDocument
+
+        sentences = make_sentences(["One.", "Two."], author="A & B")
+        output = temp_dir / "core.docx"
+        DocumentBuilder().create_document(
+            sentences=sentences,
+            output_path=str(output),
+            author="A & B",
+            title="Title <1>",
+            keywords="k1, k2"
+        )
+
+        expected_doc = DocxDocument()
+        props = expected_doc.core_properties
+        props.author = props.last_modified_by = "A & B"
+        props.title = "Title <1>"
+        props.keywords = "k1, k2"
+        props.created = sentences[0].created_timestamp
+        props.modified = sentences[-1].modified_timestamp
+        buffer = io.BytesIO()
+        expected_doc.save(buffer)
+
+        with zipfile.ZipFile(buffer) as zf:
+            expected = zf.read("docProps/core.xml")
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("docProps/core.xml") == expected
+
+    def test_control_characters_rejected(self, temp_dir, make_sentences):
+        """Test that text XML cannot represent raises instead of writing a broken file."""
+        output = temp_dir / "control.docx"
+
+        with pytest.raises(ValueError, match="XML compatible"):
+            DocumentBuilder().create_document(
+                sentences=make_sentences(["Hi\x02there.", "Next."]),
+                output_path=str(output)
+            )
+        with pytest.raises(ValueError, match="XML compatible"):
+            DocumentBuilder().create_document_with_track_changes(
+                sentences=make_sentences(["Bell\x07."]),
+                output_path=str(output)
+            )
+
+        assert not output.exists()
+
+    def test_tabs_and_breaks_match_python_docx(self, temp_dir, make_sentences):
+        """Test that tabs and line breaks become run elements as python-docx writes them."""
+        import io
+        from lxml import etree
+        from docx import Document as DocxDocument
+
+        texts = ["Name:\tValue.", "Line one\nline two\r\nend.", "\tLeading tab."]
+        output = temp_dir / "breaks.docx"
+        DocumentBuilder().create_document(sentences=make_sentences(texts), output_path=str(output))
+
+        expected_doc = DocxDocument()
+        for idx, text in enumerate(texts):
+            paragraph = expected_doc.add_paragraph()
+            paragraph.add_run(text)
+            if idx < len(texts) - 1:
+                paragraph.add_run(" ")
+        buffer = io.BytesIO()
+        expected_doc.save(buffer)
+
+        def run_content(package):
+            with zipfile.ZipFile(package) as zf:
+                root = etree.fromstring(zf.read("word/document.xml"))
+            w = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+            return [
+                [[(etree.QName(child).localname, child.text) for child in run] for run in p.iter(f"{w}r")]
+                for p in root.iter(f"{w}p")
+            ]
+
+        assert run_content(output) == run_content(buffer)
+        paragraphs = [p.text for p in DocxDocument(str(output)).paragraphs]
+        assert paragraphs == [p.text for p in DocxDocument(buffer).paragraphs]
+
+    def test_property_length_limit_and_path_result(self, temp_dir, make_sentences):
+        """Test the 255-character property limit and that paths are returned as str."""
+        output = temp_dir / "props.docx"
+
+        with pytest.raises(ValueError, match="255 char limit"):
+            DocumentBuilder().create_document(
+                sentences=make_sentences(["Long title."]),
+                output_path=output,
+                title="x" * 300
+            )
+        assert not output.exists()
+
+        result = DocumentBuilder().create_document(
+            sentences=make_sentences(["Short title."]),
+            output_path=output,
+            title="x" * 255
+        )
+        assert result == str(output)
+        assert isinstance(result, str)
@@ -0,0 +1,137 @@
+"""Tests for metadata editor."""
+
+import pytest
+import tempfile
+import zipfile
+from pathlib import Path
+from datetime import datetime
+from lxml import etree
+from dolos.document_builder import DocumentBuilder
+from dolos.metadata_editor import MetadataEditor
+from dolos.models import Sentence
+
+NS = MetadataEditor.NAMESPACES
+
+
+class TestMetadataEditor:
+    """Test in-place DOCX property editing."""
+
+    @pytest.fixture
+    def docx_path(self):
+        """Create a small DOCX to edit."""
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "doc.docx"
+            timestamp = datetime(2025, 1, 1, 10, 0, 0)
+            sentence = Sentence(
+                sentence_text="Editable sentence.",
+                position=0,
+                created_timestamp=timestamp,
+                modified_timestamp=timestamp,
+                author="Original",
+                revision_id=1
+            )
+            DocumentBuilder().create_document(
+                sentences=[sentence], output_path=str(path), author="Original"
+            )
+            yield path
+
+    def test_edit_metadata_patches_only_properties(self, docx_path):
+        """Test that core/app properties change and other parts are copied."""
+        with zipfile.ZipFile(docx_path) as zf:
+            before = {name: zf.read(name) for name in zf.namelist()}
+
+        MetadataEditor.edit_metadata(
+            str(docx_path),
+            author="Editor",
+            created_time=datetime(2024, 5, 6, 7, 8, 9),
+            total_edit_minutes=42
+        )
+
+        with zipfile.ZipFile(docx_path) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist()[0] == "[Content_Types].xml"
+            after = {name: zf.read(name) for name in zf.namelist()}
+
+        core = etree.fromstring(after["docProps/core.xml"])
+        assert core.find("dc:creator", NS).text == "Editor"
+        assert core.find("cp:lastModifiedBy", NS).text == "Editor"
+        assert core.find("dcterms:created", NS).text == "2024-05-06T07:08:09Z"
+
+        app = etree.fromstring(after["docProps/app.xml"])
+        assert app.find("ep:TotalTime", NS).text == "42"
+
+        for name, data in before.items():
+            if name not in ("docProps/core.xml", "docProps/app.xml"):
+                assert after[name] == data
+
+    def test_set_total_edit_time_replaces_existing(self, docx_path):
+        """Test that repeated edits leave a single TotalTime element."""
+        MetadataEditor.set_total_edit_time(str(docx_path), 10)
+        MetadataEditor.set_total_edit_time(str(docx_path), 25)
+
+        with zipfile.ZipFile(docx_path) as zf:
+            app = etree.fromstring(zf.read("docProps/app.xml"))
+
+        totals = app.findall("ep:TotalTime", NS)
+        assert [elem.text for elem in totals] == ["25"]
+
+    def test_unchanged_metadata_skips_rewrite(self, docx_path):
+        """Test that edits matching the current values leave the file untouched."""
+        MetadataEditor.edit_metadata(str(docx_path), author="Original", total_edit_minutes=5)
+        before = docx_path.read_bytes()
+        mtime = docx_path.stat().st_mtime_ns
+
+        MetadataEditor.edit_metadata(str(docx_path))
+        MetadataEditor.edit_metadata(str(docx_path), author="Original", total_edit_minutes=5)
+
+        assert docx_path.read_bytes() == before
+        assert docx_path.stat().st_mtime_ns == mtime
+
+    def test_untouched_parts_copied_compressed(self, docx_path):
+        """Test that unchanged entries keep their compressed bytes and CRCs."""
+        with zipfile.ZipFile(docx_path) as zf:
+            before = {info.filename: (info.CRC, info.compress_size) for info in zf.infolist()}
+
+        MetadataEditor.edit_metadata(str(docx_path), author="Editor")
+
+        with zipfile.ZipFile(docx_path) as zf:
+            assert zf.testzip() is None
+            after = {info.filename: (info.CRC, info.compress_size) for info in zf.infolist()}
+
+        assert after.keys() == before.keys()
+        for name in before:
+            if name != "docProps/core.xml":
+                assert after[name] == before[name]
+
+    def test_copies_entries_with_data_descriptors(self, docx_path):
+        """Test that entries streamed with data descriptors are copied correctly."""
+        import io
+
+        class Unseekable(io.RawIOBase):
+            """Write-only stream that forces zipfile to emit data descriptors."""
+
+            def __init__(self, sink):
+                self.sink = sink
+
+            def writable(self):
+                return True
+
+            def write(self, data):
+                return self.sink.write(data)
+
+        with zipfile.ZipFile(docx_path) as zf:
+            parts = {name: zf.read(name) for name in zf.namelist()}
+
+        sink = io.BytesIO()
+        with zipfile.ZipFile(Unseekable(sink), "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, data in parts.items():
+                zf.writestr(name, data)
+        docx_path.write_bytes(sink.getvalue())
+
+        MetadataEditor.edit_metadata(str(docx_path), total_edit_minutes=7)
+
+        with zipfile.ZipFile(docx_path) as zf:
+            assert zf.testzip() is None
+            for name, data in parts.items():
+                if name not in ("docProps/core.xml", "docProps/app.xml"):
+                    assert zf.read(name) == data
@@ -63,13 +63,15 @@ class TestMetadataManager:
         )
 
         new_time = datetime(2025, 6, 15, 12, 0, 0)
-        success = mgr.update_sentence_timestamp(
+        updated = mgr.update_sentence_timestamp(
             "update_test.docx",
             sentence_position=0,
             new_timestamp=new_time
         )
 
-        assert success is True
+        assert updated is not None
+        assert updated.sentences[0].modified_timestamp == new_time
+        assert mgr.update_sentence_timestamp("update_test.docx", 5, new_time) is None
 
         # Verify update
         doc = mgr.get_document_by_filename("update_test.docx")
@@ -91,6 +93,8 @@ class TestMetadataManager:
         assert metadata['filename'] == "metadata_test.docx"
         assert metadata['sentence_count'] == 3
         assert len(metadata['sentences']) == 3
+        assert [s['text'] for s in metadata['sentences']] == sentences
+        assert mgr.get_document_metadata("missing.docx") is None
 
     def test_delete_document(self, temp_db):
         """Test deleting document."""
@@ -128,3 +132,33 @@ class TestMetadataManager:
         # Timestamps should be in order
         for i in range(len(timestamps) - 1):
             assert timestamps[i] < timestamps[i + 1]
+
+    def test_managers_share_engine(self, temp_db):
+        """Test that managers for the same database reuse one engine."""
+        first = MetadataManager(temp_db)
+        second = MetadataManager(temp_db)
+
+        assert first.db_manager.engine is second.db_manager.engine
+
+    def test_lookup_indexes_created(self, temp_db):
+        """Test that filename and position lookup indexes exist."""
+        from sqlalchemy import inspect
+
+        mgr = MetadataManager(temp_db)
+        inspector = inspect(mgr.db_manager.engine)
+
+        sentence_indexes = {i['name']: i['column_names'] for i in inspector.get_indexes('sentences')}
+        document_indexes = {i['name']: i['column_names'] for i in inspector.get_indexes('documents')}
+
+        assert sentence_indexes['idx_sentences_doc_pos'] == ['document_id', 'position']
+        assert document_indexes['idx_documents_filename'] == ['filename']
+
+    def test_in_memory_managers_are_isolated(self):
+        """Test that each in-memory manager gets its own database."""
+        first = MetadataManager(":memory:")
+        first.create_document(filename="x.docx", sentences=["Only here."])
+
+        second = MetadataManager(":memory:")
+
+        assert first.get_document_by_filename("x.docx") is not None
+        assert second.get_document_by_filename("x.docx") is None
@@ -0,0 +1,117 @@
+"""Tests for document sanitizer."""
+
+import pytest
+import tempfile
+import zipfile
+from pathlib import Path
+from datetime import datetime
+from lxml import etree
+from docx import Document as DocxDocument
+from dolos.document_builder import DocumentBuilder
+from dolos.models import Sentence
+from dolos.sanitizer import DocumentSanitizer
+
+NS = {
+    'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'cp': 'http://schemas.openxmlformats.org/package/2006/metadata/core-properties',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+
+
+class TestDocumentSanitizer:
+    """Test document sanitization."""
+
+    @pytest.fixture
+    def tracked_docx(self):
+        """Create a DOCX with tracked insertions."""
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "tracked.docx"
+            timestamp = datetime(2025, 1, 1, 10, 0, 0)
+            sentences = [
+                Sentence(
+                    sentence_text=text,
+                    position=idx,
+                    created_timestamp=timestamp,
+                    modified_timestamp=timestamp,
+                    author="Writer",
+                    revision_id=idx + 1
+                )
+                for idx, text in enumerate(["First one.", "Second one."])
+            ]
+            DocumentBuilder().create_document_with_track_changes(
+                sentences=sentences, output_path=str(path), author="Writer"
+            )
+            yield path
+
+    def test_sanitize_in_place(self, tracked_docx):
+        """Test that sanitizing over the input removes revisions and keeps text."""
+        with zipfile.ZipFile(tracked_docx) as zf:
+            before = {name: zf.read(name) for name in zf.namelist()}
+
+        DocumentSanitizer().sanitize_document(str(tracked_docx), str(tracked_docx))
+
+        with zipfile.ZipFile(tracked_docx) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == list(before)
+            document = etree.fromstring(zf.read("word/document.xml"))
+            settings = zf.read("word/settings.xml")
+            core = etree.fromstring(zf.read("docProps/core.xml"))
+            styles = zf.read("word/styles.xml")
+
+        assert document.find(".//w:ins", NS) is None
+        assert b"trackRevisions" not in settings
+        assert core.find("dc:creator", NS).text == "Anonymous"
+        assert core.find("dcterms:created", NS).text == "2000-01-01T00:00:00Z"
+        assert styles == before["word/styles.xml"]
+
+        paragraphs = [p.text for p in DocxDocument(str(tracked_docx)).paragraphs]
+        assert paragraphs == ["First one. ", "Second one."]
+
+    def test_remove_track_changes_unwraps_in_order(self):
+        """Test that insertions unwrap in order and deletions are dropped."""
+        root = etree.fromstring(
+            '<w:body xmlns:w="%s"><w:p>'
+            '<w:ins><w:r><w:t>A</w:t></w:r><w:r><w:t>B</w:t></w:r><w:r><w:t>C</w:t></w:r></w:ins>'
+            '<w:del><w:r><w:delText>gone</w:delText></w:r></w:del>'
+            '<w:r><w:rPr><w:rPrChange/></w:rPr><w:t>D</w:t></w:r>'
+            '</w:p></w:body>' % NS['w']
+        )
+
+        DocumentSanitizer()._remove_track_changes(root)
+
+        texts = [t.text for t in root.iterfind('.//w:t', NS)]
+        assert texts == ["A", "B", "C", "D"]
+        assert root.find('.//w:del', NS) is None
+        assert root.find('.//w:rPrChange', NS) is None
+
+    def test_body_without_revisions_copied_unchanged(self, tracked_docx):
+        """Test that a document body with no revisions is left byte-identical."""
+        DocumentSanitizer().sanitize_document(str(tracked_docx), str(tracked_docx))
+        with zipfile.ZipFile(tracked_docx) as zf:
+            clean_body = zf.read("word/document.xml")
+
+        output = tracked_docx.with_name("again.docx")
+        DocumentSanitizer().sanitize_document(str(tracked_docx), str(output))
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.read("word/document.xml") == clean_body
+
+    def test_sanitize_documents_in_parallel(self, tracked_docx):
+        """Test sanitizing a batch of documents across worker processes."""
+        jobs = [
+            {
+                "input_path": str(tracked_docx),
+                "output_path": str(tracked_docx.with_name(f"clean_{idx}.docx"))
+            }
+            for idx in range(3)
+        ]
+
+        paths = DocumentSanitizer().sanitize_documents(jobs, max_workers=2)
+
+        assert paths == [job["output_path"] for job in jobs]
+        for path in paths:
+            with zipfile.ZipFile(path) as zf:
+                document = zf.read("word/document.xml")
+            assert b"<w:ins " not in document
+            assert b"Second one." in document
@@ -65,3 +65,13 @@ class TestSentenceParser:
         sentences = split_into_sentences(text)
 
         assert len(sentences) >= 1
+
+    def test_split_into_sentences_returns_fresh_list(self):
+        """Test cached results are not shared between callers."""
+        text = "Cached sentence one. Cached sentence two."
+        first = split_into_sentences(text)
+        first.append("mutated")
+
+        second = split_into_sentences(text)
+
+        assert second == ["Cached sentence one.", "Cached sentence two."]
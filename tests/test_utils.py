@@ -21,6 +21,11 @@ class TestUtils:
         for interval in intervals:
             assert 30 <= interval <= 300
 
+    def test_generate_random_intervals_invalid_bounds(self):
+        """Test that reversed bounds raise ValueError."""
+        with pytest.raises(ValueError):
+            generate_random_intervals(3, 300, 30)
+
     def test_generate_timestamps(self):
         """Test generating timestamps."""
         start = datetime(2025, 1, 1, 10, 0, 0)
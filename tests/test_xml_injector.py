@@ -0,0 +1,142 @@
+"""Tests for track changes injection."""
+
+import pytest
+import tempfile
+import zipfile
+from pathlib import Path
+from datetime import datetime
+from dolos.document_builder import DocumentBuilder
+from dolos.xml_injector import TrackChangesInjector
+
+
+class TestTrackChangesInjector:
+    """Test track changes injection functionality."""
+
+    @pytest.fixture
+    def tracked_docx(self, make_sentences):
+        """Create a tracked-changes document in a temporary directory."""
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "tracked.docx"
+            DocumentBuilder().create_document_with_track_changes(
+                sentences=make_sentences(["One.", "Two.", "Three."]),
+                output_path=str(path)
+            )
+            yield path
+
+    def test_patch_timestamps(self, tracked_docx):
+        """Test patching a single insertion date in place."""
+        new_time = datetime(2025, 2, 15, 15, 30, 0)
+
+        TrackChangesInjector().patch_timestamps(str(tracked_docx), {1: new_time})
+
+        with zipfile.ZipFile(tracked_docx) as zf:
+            document_xml = zf.read("word/document.xml")
+
+        assert b'w:date="2025-01-01T10:00:00Z"' in document_xml
+        assert b'w:date="2025-02-15T15:30:00Z"' in document_xml
+        assert b'w:date="2025-01-01T10:01:00Z"' not in document_xml
+        assert b'w:date="2025-01-01T10:02:00Z"' in document_xml
+
+    def test_patch_timestamps_invalid_position(self, tracked_docx):
+        """Test patching a sentence that has no tracked insertion."""
+        with pytest.raises(ValueError):
+            TrackChangesInjector().patch_timestamps(
+                str(tracked_docx), {5: datetime(2025, 1, 1)}
+            )
+
+    def test_inject_track_changes_in_memory(self, make_sentences):
+        """Test handing a document from builder to injector through a buffer."""
+        import io
+
+        sentences = make_sentences(["Buffered one.", "Buffered two."])
+        buffer = io.BytesIO()
+        DocumentBuilder().create_document(sentences=sentences, output_path=buffer)
+
+        result = TrackChangesInjector().inject_track_changes(docx_path=buffer, sentences=sentences)
+
+        assert result is buffer
+        with zipfile.ZipFile(buffer) as zf:
+            assert zf.namelist()[0] == "[Content_Types].xml"
+            document_xml = zf.read("word/document.xml")
+            assert b"trackRevisions" in zf.read("word/settings.xml")
+
+        assert document_xml.count(b"<w:ins ") == 2
+        assert document_xml.count(b"Buffered one.") == 1
+
+    def test_body_splice_matches_tree_edit(self, monkeypatch, make_sentences):
+        """Test that splicing into an empty body matches the tree-based edit."""
+        from lxml import etree
+        from dolos import xml_injector
+        from dolos.document_builder import _template_parts
+
+        monkeypatch.setattr(xml_injector, "_new_rsids", lambda count: [b"00ABCDEF"] * count)
+        sentences = make_sentences(["Spliced & one.", "Spliced two."])
+        injector = TrackChangesInjector()
+
+        parts = {"word/document.xml": _template_parts()["word/document.xml"]}
+        injector.inject_into_parts(parts, sentences)
+
+        root = etree.fromstring(_template_parts()["word/document.xml"])
+        xml_injector._replace_body_paragraphs(root, injector._tracked_paragraphs(sentences))
+
+        assert parts["word/document.xml"] == injector._serialize(root)
+
+    def test_media_parts_stored_uncompressed(self, tracked_docx, make_sentences):
+        """Test that already-compressed media is stored rather than deflated."""
+        with zipfile.ZipFile(tracked_docx, "a") as zf:
+            zf.writestr("word/media/image1.png", b"\x89PNG" * 64, compress_type=zipfile.ZIP_DEFLATED)
+
+        TrackChangesInjector().inject_track_changes(
+            str(tracked_docx), make_sentences(["With media."])
+        )
+
+        with zipfile.ZipFile(tracked_docx) as zf:
+            assert zf.testzip() is None
+            assert zf.getinfo("word/media/image1.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("word/document.xml").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.read("word/media/image1.png") == b"\x89PNG" * 64
+
+    def test_inject_copies_untouched_parts_compressed(self, tracked_docx, make_sentences):
+        """Test that parts the injection does not rewrite keep their compressed bytes."""
+        with zipfile.ZipFile(tracked_docx) as zf:
+            before = {info.filename: (info.CRC, info.compress_size) for info in zf.infolist()}
+
+        TrackChangesInjector().inject_track_changes(
+            str(tracked_docx), make_sentences(["Rewritten."])
+        )
+
+        with zipfile.ZipFile(tracked_docx) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist()[0] == "[Content_Types].xml"
+            after = {info.filename: (info.CRC, info.compress_size) for info in zf.infolist()}
+            assert b"Rewritten." in zf.read("word/document.xml")
+
+        assert after.keys() == before.keys()
+        for name in ("word/styles.xml", "docProps/core.xml", "word/theme/theme1.xml"):
+            assert after[name] == before[name]
+
+    def test_new_rsids_are_hex(self):
+        """Test that batched RSIDs are 8 uppercase hex digits each."""
+        from dolos.xml_injector import _new_rsids
+
+        rsids = _new_rsids(50)
+
+        assert len(rsids) == 50
+        assert all(len(rsid) == 8 and int(rsid, 16) >= 0 for rsid in rsids)
+        assert all(rsid == rsid.upper() for rsid in rsids)
+        assert _new_rsids(0) == []
+
+    def test_carriage_return_round_trips(self, make_sentences):
+        """Test that a carriage return in sentence text survives injection unchanged."""
+        from lxml import etree
+        from dolos._xml_fast import W_NS, _xml_escape
+
+        assert _xml_escape("a\rb") == b"a&#13;b"
+
+        sentences = make_sentences(["Line\rbreak."])
+        injector = TrackChangesInjector()
+        root = etree.fromstring(b"<w:body xmlns:w=\"%s\">%s</w:body>" % (
+            W_NS.encode(), injector._tracked_paragraphs(sentences)
+        ))
+        texts = root.xpath("//w:t/text()", namespaces={"w": W_NS})
+        assert texts == ["Line\rbreak."]
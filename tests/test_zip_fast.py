@@ -0,0 +1,50 @@
+"""Tests for raw ZIP entry copying."""
+
+import io
+import zipfile
+
+import pytest
+
+from dolos._zip_fast import _copy_entry
+
+
+def make_archive():
+    """Create an in-memory archive with deflated and stored entries."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('word/document.xml', b'<w:document/>' * 100)
+        zf.writestr('word/media/image1.png', b'\x89PNG' * 50, compress_type=zipfile.ZIP_STORED)
+    buffer.seek(0)
+    return buffer
+
+
+class TestCopyEntry:
+    """Test copying compressed entries between archives."""
+
+    def test_copied_entries_round_trip(self):
+        """Test that copied entries pass testzip and keep their bytes and CRCs."""
+        output = io.BytesIO()
+        with zipfile.ZipFile(make_archive()) as zin:
+            with zipfile.ZipFile(output, 'w') as zout:
+                for info in zin.infolist():
+                    _copy_entry(zin, zout, info)
+                zout.writestr('extra.xml', b'<extra/>')
+            expected = {info.filename: (info.CRC, info.compress_type) for info in zin.infolist()}
+            data = {name: zin.read(name) for name in zin.namelist()}
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            for name, (crc, compress_type) in expected.items():
+                info = zf.getinfo(name)
+                assert (info.CRC, info.compress_type) == (crc, compress_type)
+                assert zf.read(name) == data[name]
+            assert zf.read('extra.xml') == b'<extra/>'
+
+    def test_rejects_copy_while_writing(self):
+        """Test that copying while a write handle is open raises instead of corrupting."""
+        with zipfile.ZipFile(make_archive()) as zin:
+            with zipfile.ZipFile(io.BytesIO(), 'w') as zout:
+                with zout.open('open.xml', 'w') as handle:
+                    handle.write(b'<open/>')
+                    with pytest.raises(ValueError):
+                        _copy_entry(zin, zout, zin.infolist()[0])